@@ -5,18 +5,118 @@ Fixes QTimer thread warnings and sudo execution problems
 
 import subprocess
 import threading
-import queue
+import selectors
 import time
 import os
 import signal
 import re
 import shlex
+import sys
+import struct
+import ctypes
+import functools
+import itertools
+import queue
+import shutil
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from typing import Optional, Callable, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex, QWaitCondition, QTimer
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread, QTimer
 from PyQt6.QtWidgets import QApplication, QInputDialog, QLineEdit, QMessageBox
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# Case-insensitive single-pass matcher (avoids a lowercased copy of the command)
+_SAFE_EXCEPTIONS_RE = re.compile(r'pacman|yay|paru|flatpak|systemctl|journalctl', re.IGNORECASE)
+
+# Whole stderr lines containing a sudo prompt or sudo auth message
+_SUDO_PROMPT_RE = re.compile(
+    r'^.*(?:\[sudo\] password for|Password:|Enter password:|Sorry, try again\.'
+    r'|sudo: 3 incorrect password|sudo: a terminal is required|sudo: a password is required).*\n?',
+    re.MULTILINE
+)
+
+# sudo's own authentication lines: optional prompts, then a rejection message
+_SUDO_AUTH_PROMPT = r'(?:\[sudo\] password for [^:\n]*:|Password:)\s*'
+_SUDO_AUTH_FAILURE_RE = re.compile(
+    rf'(?:{_SUDO_AUTH_PROMPT})*(?:Sorry, try again\.|sudo: \d+ incorrect password attempts?'
+    r'|sudo: a password is required|sudo: no password was provided)'
+)
+_SUDO_AUTH_PROMPT_RE = re.compile(rf'(?:{_SUDO_AUTH_PROMPT})+')
+
+def _spawn_capture(argv: List[str], stdin_data: Optional[bytes] = None,
+                   timeout: float = 5) -> Tuple[int, bytes, bytes]:
+    """Run a short helper command and capture its output
+
+    Uses os.posix_spawn so quick probes don't fork() the whole GUI process.
+    Raises subprocess.TimeoutExpired on timeout (the child is killed).
+    """
+    if not hasattr(os, 'posix_spawn'):
+        result = subprocess.run(argv, input=stdin_data, capture_output=True, timeout=timeout)
+        return result.returncode, result.stdout, result.stderr
+
+    path = shutil.which(argv[0])
+    if path is None:
+        raise FileNotFoundError(f"Command not found: {argv[0]}")
+
+    stdin_r, stdin_w = os.pipe()
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+    try:
+        pid = os.posix_spawn(path, argv, os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, stdin_r, 0),
+            (os.POSIX_SPAWN_DUP2, stdout_w, 1),
+            (os.POSIX_SPAWN_DUP2, stderr_w, 2),
+        ], setsigdef=(signal.SIGPIPE,))  # Python ignores SIGPIPE; restore it like Popen does
+    except OSError:
+        for fd in (stdin_w, stdout_r, stderr_r):
+            os.close(fd)
+        raise
+    finally:
+        for fd in (stdin_r, stdout_w, stderr_w):
+            os.close(fd)
+
+    # Helper input is tiny (a password) and fits into the pipe buffer
+    try:
+        if stdin_data:
+            os.write(stdin_w, stdin_data)
+    except OSError:
+        pass
+    finally:
+        os.close(stdin_w)
+
+    output = {stdout_r: bytearray(), stderr_r: bytearray()}
+    deadline = time.monotonic() + timeout
+    try:
+        with selectors.DefaultSelector() as sel:
+            for fd in output:
+                sel.register(fd, selectors.EVENT_READ)
+
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                    raise subprocess.TimeoutExpired(argv, timeout)
+
+                for key, _ in sel.select(timeout=remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        output[key.fd].extend(chunk)
+                    else:
+                        sel.unregister(key.fd)
+    finally:
+        os.close(stdout_r)
+        os.close(stderr_r)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), bytes(output[stdout_r]), bytes(output[stderr_r])
+
 class CommandStatus(Enum):
     """Command execution status"""
     PENDING = "pending"
@@ -27,9 +127,11 @@ class CommandStatus(Enum):
     NEEDS_PASSWORD = "needs_password"
     LOCKED = "locked"
 
-@dataclass
+@dataclass(frozen=True)
 class CommandResult:
     """Result of command execution"""
+    __slots__ = ('command', 'status', 'return_code', 'stdout', 'stderr', 'execution_time')
+
     command: str
     status: CommandStatus
     return_code: int
@@ -37,8 +139,44 @@ class CommandResult:
     stderr: str
     execution_time: float
 
+@dataclass(frozen=True)
+class BatchResult:
+    """Result of one tool in a batch execution"""
+    __slots__ = ('tool', 'result', 'success', 'error')
+
+    tool: object
+    result: Optional[CommandResult]
+    success: bool
+    error: Optional[str]
+
 class CommandSecurity:
     """Enhanced Command Security - Blocks unsafe and problematic commands"""
+
+    DANGEROUS_PATTERNS = (
+        r'\*\s*/\s*',    # */ patterns
+        r'rm\s+.*\*',    # rm with wildcards
+        r'chmod\s+.*\*', # chmod with wildcards
+        r'>\s*/dev/',    # redirect to /dev/
+        r'\|\s*rm',      # pipe to rm
+    )
+
+    INJECTION_CHARS = frozenset(';&`$()')
+
+    # Compiled once for all instances, one group per pattern
+    _DANGEROUS_RE = re.compile(
+        '|'.join(f"({pattern})" for pattern in DANGEROUS_PATTERNS), re.IGNORECASE
+    )
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'CommandSecurity':
+        """Process-wide rule set, so rules are compiled and verdicts cached once"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
     
     def __init__(self):
         # Absolut verbotene Befehle (Sicherheitsrisiko)
@@ -49,7 +187,7 @@ class CommandSecurity:
             ':(){ :|:& };:', 'chmod -R 777 /', 'chown -R',
             'systemctl disable', 'systemctl mask'
         }
-        
+
         # Problematische Befehle (funktionieren nicht richtig in diesem Kontext)
         self.problematic_commands = {
             'cp ': 'cp commands often fail in this context - use package managers instead',
@@ -61,44 +199,129 @@ class CommandSecurity:
             'make install': 'use AUR helpers like yay or paru instead'
         }
 
+        self._build_rule_matcher()
+
+        # Verdicts only depend on the (constant) rules, so memoize per command
+        self._check_cached = functools.lru_cache(maxsize=512)(self._check_command)
+
+    def _build_rule_matcher(self):
+        """Compile forbidden and problematic entries into prefix-trie regexes
+
+        Entries are merged into a trie (dict of dicts) and emitted as a
+        prefix-factored alternation, so shared prefixes such as 'rm -rf ' are
+        matched once. Every entry ends in an empty group; the matching group
+        index maps back to the (kind, message) in that regex's rule list.
+        Longer entries are tried before shorter ones they extend, so
+        overlapping entries report the most specific one.
+
+        Forbidden and problematic entries get one regex each, and the
+        forbidden one is searched first, so a forbidden entry anywhere in the
+        command wins over a problematic one. Problematic entries only match at
+        the start of a word.
+
+        Lowercase entries match case-insensitively. Entries containing
+        uppercase letters (e.g. 'wget -O') match exactly, so 'wget -o' (a log
+        file option) is not mistaken for 'wget -O'.
+        """
+        forbidden = self._compile_rule_set(
+            (cmd, ('forbidden', f"Forbidden command: {cmd}")) for cmd in self.forbidden_commands
+        )
+        problematic = self._compile_rule_set(
+            ((entry, ('problematic', f"Problematic command: {reason}"))
+             for entry, reason in self.problematic_commands.items()),
+            prefix='(?<![^ ])'
+        )
+        self._rule_sets = (forbidden, problematic)
+
+        # Cheap gate: a match needs one of these starting characters and a minimum length
+        entries = list(self.forbidden_commands) + list(self.problematic_commands)
+        self._rule_first_chars = frozenset(
+            c for entry in entries
+            for c in ((entry[0].lower(), entry[0].upper()) if entry == entry.lower() else (entry[0],))
+        )
+        self._rule_min_len = min(len(entry) for entry in entries)
+
+    def _compile_rule_set(self, entries, prefix: str = ''):
+        """Compile (text, payload) pairs into a (regex, payloads) pair
+
+        Lowercase entries go into a case-insensitive trie, entries with
+        uppercase letters into an exact-case one.
+        """
+        entries = list(entries)
+        insensitive = [(text, payload) for text, payload in entries if text == text.lower()]
+        exact = [(text, payload) for text, payload in entries if text != text.lower()]
+
+        rules = []
+        alternatives = []
+        if insensitive:
+            alternatives.append(f"(?i:{self._trie_pattern(insensitive, rules)})")
+        if exact:
+            alternatives.append(self._trie_pattern(exact, rules))
+        pattern = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+        return re.compile(prefix + pattern), rules
+
+    def _trie_pattern(self, entries, rules: list) -> str:
+        """Build a trie from (text, payload) pairs and return its regex"""
+        trie = {}
+        for text, payload in entries:
+            node = trie
+            for char in text:
+                node = node.setdefault(char, {})
+            node[None] = payload  # end of an entry
+        return self._trie_node_pattern(trie, rules)
+
+    def _trie_node_pattern(self, node: dict, rules: list) -> str:
+        """Regex for a trie node; registers each entry's group in rules"""
+        alternatives = [
+            re.escape(char) + self._trie_node_pattern(child, rules)
+            for char, child in node.items() if char is not None
+        ]
+        # Terminal group last so longer entries win; appended after the
+        # children so group numbers follow the pattern order
+        if None in node:
+            rules.append(node[None])
+            alternatives.append('()')
+
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return f"(?:{'|'.join(alternatives)})"
+
+    def reload_rules(self):
+        """Recompile the rules after changing forbidden/problematic entries"""
+        self._build_rule_matcher()
+        self._check_cached.cache_clear()
+
     def is_command_safe(self, command: str) -> Tuple[bool, Optional[str]]:
-        """Comprehensive command safety check"""
+        """Comprehensive command safety check (cached per command string)"""
+        return self._check_cached(command)
+
+    def _check_command(self, command: str) -> Tuple[bool, Optional[str]]:
+        """Run all safety rules against a command"""
         command = command.strip()
-        command_lower = command.lower()
-        
-        # 1. Check forbidden commands
-        for forbidden in self.forbidden_commands:
-            if forbidden in command_lower:
-                return False, f"Forbidden command: {forbidden}"
-        
-        # 2. Check problematic commands
-        for problematic, reason in self.problematic_commands.items():
-            if command_lower.startswith(problematic) or f" {problematic}" in command_lower:
-                return False, f"Problematic command: {reason}"
+
+        # 1./2. Check forbidden, then problematic commands
+        # (skip the regexes when no match is possible)
+        if (len(command) >= self._rule_min_len
+                and not self._rule_first_chars.isdisjoint(command)):
+            for rules_re, rules in self._rule_sets:
+                match = rules_re.search(command)
+                if match:
+                    kind, message = rules[match.lastindex - 1]
+                    return False, message
         
         # 3. Check dangerous patterns
-        dangerous_patterns = [
-            r'\*\s*/\s*',    # */ patterns
-            r'rm\s+.*\*',    # rm with wildcards
-            r'chmod\s+.*\*', # chmod with wildcards
-            r'>\s*/dev/',    # redirect to /dev/
-            r'\|\s*rm',      # pipe to rm
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, command_lower):
-                return False, f"Dangerous pattern: {pattern}"
+        match = self._DANGEROUS_RE.search(command)
+        if match:
+            return False, f"Dangerous pattern: {self.DANGEROUS_PATTERNS[match.lastindex - 1]}"
         
         # 4. Check path traversal
         if '../' in command or '/..' in command:
             return False, "Path traversal detected"
         
         # 5. Check shell injection (with exceptions for safe commands)
-        injection_chars = [';', '&', '`', '$', '(', ')']
-        if any(char in command for char in injection_chars):
+        if not self.INJECTION_CHARS.isdisjoint(command):
             # Allow for safe package managers
-            safe_exceptions = ['pacman', 'yay', 'paru', 'flatpak', 'systemctl', 'journalctl']
-            if not any(safe_cmd in command_lower for safe_cmd in safe_exceptions):
+            if not _SAFE_EXCEPTIONS_RE.search(command):
                 return False, "Potential shell injection"
         
         return True, None
@@ -109,13 +332,36 @@ class ThreadSafePasswordManager(QObject):
     password_requested = pyqtSignal(str)  # request_id
     password_provided = pyqtSignal(str, str)  # request_id, password
 
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> 'ThreadSafePasswordManager':
+        """Process-wide password manager so all executors share one password cache"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                manager = cls()
+
+                # Dialogs must run in the GUI thread even when first used from a worker
+                app = QApplication.instance()
+                if app and QThread.currentThread() != app.thread():
+                    manager.moveToThread(app.thread())
+
+                cls._instance = manager
+            return cls._instance
+
     def __init__(self):
         super().__init__()
         
         # Password caching - NO QTimer usage!
-        self.password_cache = None
-        self.password_valid_until = 0
+        # (password, valid_until) is replaced as a whole, so readers take a
+        # consistent snapshot without the lock; only writers lock
+        self._cache_state: Tuple[Optional[str], float] = (None, 0)
         self.cache_duration = 900  # 15 minutes
+
+        # While sudo's own timestamp is fresh, commands run with 'sudo -n'
+        self.sudo_timestamp_window = 240  # below sudo's default 5 minute timestamp_timeout
+        self._sudo_timestamp_until = 0.0
         
         # Error handling
         self.password_attempts = 0
@@ -124,49 +370,77 @@ class ThreadSafePasswordManager(QObject):
         
         # Thread synchronization
         self.pending_requests = {}
+        self._request_ids = itertools.count()  # next() is atomic, ids only key pending_requests
         self._lock = threading.Lock()
         
         # Connect signals
         self.password_requested.connect(self._show_password_dialog)
         self.password_provided.connect(self._handle_password_response)
 
+    @property
+    def password_cache(self) -> Optional[str]:
+        """Cached password (may be expired)"""
+        return self._cache_state[0]
+
+    @property
+    def password_valid_until(self) -> float:
+        """Expiry time of the cached password"""
+        return self._cache_state[1]
+
+    def get_cached_password(self) -> Optional[str]:
+        """Return the cached password if it hasn't expired (lock-free)"""
+        password, valid_until = self._cache_state
+        if password and time.time() <= valid_until:
+            return password
+        return None
+
+    def mark_sudo_timestamp(self):
+        """Remember that sudo just authenticated (its timestamp is fresh)"""
+        self._sudo_timestamp_until = time.monotonic() + self.sudo_timestamp_window
+
+    def expire_sudo_timestamp(self):
+        """Forget the sudo timestamp, e.g. after 'sudo -n' asked for a password"""
+        self._sudo_timestamp_until = 0.0
+
+    def has_sudo_timestamp(self) -> bool:
+        """Whether sudo should still accept commands without a password"""
+        return time.monotonic() < self._sudo_timestamp_until
+
     def is_password_cached_and_valid(self) -> bool:
-        """Check if cached password is still valid - NO QTimer"""
-        with self._lock:
-            if not self.password_cache:
-                return False
-            
-            # Check time limit
-            current_time = time.time()
-            if current_time > self.password_valid_until:
-                self.password_cache = None
-                return False
-            
-            # Quick sudo session check
-            return self.verify_sudo_session_simple()
+        """Check if cached password is still valid - NO QTimer
+
+        Only the in-memory TTL is checked. The commands pass the password via
+        'sudo -S', so an expired sudo timestamp doesn't matter, and a rejected
+        password is detected from the command's stderr (cache invalidated).
+        """
+        return self.get_cached_password() is not None
 
     def verify_sudo_session_simple(self) -> bool:
         """Simple sudo session check without timer complications"""
         try:
             # Test with harmless sudo command without password
-            result = subprocess.run(
+            return_code, _, _ = _spawn_capture(
                 ['sudo', '-n', 'true'],  # -n = non-interactive
-                capture_output=True,
                 timeout=2
             )
             
-            return result.returncode == 0
+            return return_code == 0
             
         except Exception:
             return False
 
+    def new_request_id(self) -> str:
+        """Unique id for a password request"""
+        return str(next(self._request_ids))
+
     def request_password(self, request_id: str) -> Optional[str]:
         """Request password with intelligent caching - NO QTimer"""
         
         # 1. Check cached password
-        if self.is_password_cached_and_valid():
+        password = self.get_cached_password()
+        if password:
             print("🔐 Using cached password")
-            return self.password_cache
+            return password
         
         # 2. Check rate limiting after failures
         current_time = time.time()
@@ -178,32 +452,23 @@ class ThreadSafePasswordManager(QObject):
         # 3. New password input required
         print("🔑 Requesting new password input")
         
-        # Thread-safe password input
-        mutex = QMutex()
-        wait_condition = QWaitCondition()
-
-        self.pending_requests[request_id] = {
-            'mutex': mutex,
-            'condition': wait_condition,
-            'password': None,
-            'completed': False
-        }
+        # Thread-safe password input: the main-thread slot resolves the future
+        future = Future()
+        self.pending_requests[request_id] = future
 
         # Request password from main thread
         self.password_requested.emit(request_id)
 
         # Wait for response (with timeout)
-        mutex.lock()
         try:
-            if not self.pending_requests[request_id]['completed']:
-                wait_condition.wait(mutex, 30000)  # 30 second timeout
-
-            result = self.pending_requests[request_id]['password']
-            del self.pending_requests[request_id]
-            return result
+            return future.result(timeout=30)
+        except FutureTimeoutError:
+            print("❌ Password request timed out")
+            return None
         finally:
-            mutex.unlock()
+            self.pending_requests.pop(request_id, None)
 
+    @pyqtSlot(str)
     def _show_password_dialog(self, request_id: str):
         """Show password dialog in main thread"""
         app = QApplication.instance()
@@ -231,8 +496,7 @@ class ThreadSafePasswordManager(QObject):
             if self.validate_sudo_password(password):
                 # Password is correct - cache it with timestamp
                 with self._lock:
-                    self.password_cache = password
-                    self.password_valid_until = time.time() + self.cache_duration
+                    self._cache_state = (password, time.time() + self.cache_duration)
                     self.password_attempts = 0  # Reset counter
                 
                 print("✅ Password validation successful")
@@ -257,22 +521,19 @@ class ThreadSafePasswordManager(QObject):
     def validate_sudo_password(self, password: str) -> bool:
         """Validate sudo password WITHOUT showing stderr"""
         try:
-            # Test with harmless command
-            process = subprocess.Popen(
-                ['sudo', '-S', 'true'],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,  # Capture stderr but don't show it
-                text=True
+            # Validate and prime sudo's timestamp in one call, send password
+            # (stderr is captured but not shown)
+            return_code, _, _ = _spawn_capture(
+                ['sudo', '-S', '-v'],
+                stdin_data=(password + '\n').encode(),
+                timeout=5
             )
 
-            # Send password
-            stdout, stderr = process.communicate(input=password + '\n', timeout=5)
-
             # Only check return code, DON'T propagate stderr
-            success = (process.returncode == 0)
+            success = (return_code == 0)
             
             if success:
+                self.mark_sudo_timestamp()
                 print("🔐 Password validation successful")
             else:
                 print("❌ Password validation failed")
@@ -313,31 +574,116 @@ class ThreadSafePasswordManager(QObject):
         msg.setInformativeText("Please wait 30 seconds before trying again.")
         msg.exec()
 
+    @pyqtSlot(str, str)
     def _handle_password_response(self, request_id: str, password: str):
         """Handle password response"""
         self._complete_request(request_id, password)
 
     def _complete_request(self, request_id: str, password: Optional[str]):
         """Complete password request"""
-        if request_id in self.pending_requests:
-            request_data = self.pending_requests[request_id]
-            request_data['password'] = password
-            request_data['completed'] = True
-            request_data['condition'].wakeAll()
+        future = self.pending_requests.pop(request_id, None)
+        if future is not None:
+            future.set_result(password)
 
     def invalidate_cache(self):
         """Invalidate password cache manually"""
         with self._lock:
-            self.password_cache = None
-            self.password_valid_until = 0
+            self._cache_state = (None, 0)
             self.password_attempts = 0
+        self.expire_sudo_timestamp()
         print("🔐 Password cache invalidated")
 
     def increment_attempts(self):
         """Increment failed attempts"""
         self.password_attempts += 1
         if self.password_attempts >= self.max_attempts:
-            self.password_cache = None
+            with self._lock:
+                self._cache_state = (None, 0)
+
+class PacmanLockWatcher:
+    """Tracks the pacman lock file through inotify instead of a stat per command"""
+
+    LOCK_DIR = '/var/lib/pacman'
+    LOCK_NAME = 'db.lck'
+
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000  # events were dropped
+    IN_IGNORED = 0x8000  # watch removed (directory deleted or unmounted)
+    IN_CLOEXEC = 0o2000000
+    EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> Optional['PacmanLockWatcher']:
+        """Process-wide watcher, None where inotify is not available"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                try:
+                    cls._shared = cls()
+                except (OSError, AttributeError) as e:
+                    print(f"⚠️ Pacman lock watcher unavailable: {e}")
+                    cls._shared = False
+            return cls._shared or None
+
+    def __init__(self):
+        if not sys.platform.startswith('linux') or not os.path.isdir(self.LOCK_DIR):
+            raise OSError(f"{self.LOCK_DIR} not available")
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = self.IN_CREATE | self.IN_DELETE | self.IN_MOVED_FROM | self.IN_MOVED_TO
+        if libc.inotify_add_watch(self._fd, self.LOCK_DIR.encode(), mask) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+        # Initial state is read after the watch exists so no change is missed
+        self.lock_path = os.path.join(self.LOCK_DIR, self.LOCK_NAME)
+        self.locked = os.path.exists(self.lock_path)
+        self.active = True  # False once the watch is gone - callers stat the file then
+
+        threading.Thread(target=self._watch, name="pacman-lock-watcher", daemon=True).start()
+
+    def _watch(self):
+        """Update the lock state from inotify events (daemon thread)"""
+        lock_name = self.LOCK_NAME.encode()
+        header_size = self.EVENT_HEADER.size
+
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except OSError:
+                self.active = False
+                return
+
+            offset = 0
+            while offset + header_size <= len(data):
+                _, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + header_size:offset + header_size + length].rstrip(b'\0')
+                offset += header_size + length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    # Lost events - the file itself is the only reliable state
+                    self.locked = os.path.exists(self.lock_path)
+                    continue
+                if mask & self.IN_IGNORED:
+                    self.active = False
+                    os.close(self._fd)
+                    return
+                if name != lock_name:
+                    continue
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self.locked = True
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    self.locked = False
+
 
 class FixedCommandExecutor(QObject):
     """Fixed Command Executor with proper thread handling and sudo support"""
@@ -348,6 +694,11 @@ class FixedCommandExecutor(QObject):
     command_finished = pyqtSignal(object)  # CommandResult
     password_required = pyqtSignal()  # Password needed
 
+    READ_CHUNK_SIZE = 65536
+    PIPE_BUFFER_SIZE = 1 << 20
+    OUTPUT_FLUSH_INTERVAL = 0.05  # seconds between batched output_received emits
+    LOCK_CHECK_TTL = 0.5  # seconds a stat of the pacman lock file stays valid
+
     def __init__(self, output_callback: Optional[Callable] = None):
         super().__init__()
         self.output_callback = output_callback
@@ -355,9 +706,36 @@ class FixedCommandExecutor(QObject):
         self.is_running = False
         self.should_cancel = False
 
-        # Enhanced components
-        self.password_manager = ThreadSafePasswordManager()
-        self.command_security = CommandSecurity()
+        # Environment for child processes, built once instead of per command
+        self.refresh_env()
+
+        # Output lines are batched so the GUI gets one queued signal per interval
+        self._pending_output = {'stdout': [], 'stderr': []}
+        self._output_flushed_at = 0.0
+
+        # Pacman lock state via inotify (None -> stat the lock file)
+        self._pacman_lock_watcher = PacmanLockWatcher.shared()
+        self._lock_state = False
+        self._lock_checked_at = float('-inf')
+
+        # Enhanced components (password manager is created on first sudo use)
+        self._password_manager: Optional[ThreadSafePasswordManager] = None
+        self.command_security = CommandSecurity.shared()
+
+        # Executors running tools on worker threads on behalf of this one
+        self._worker_executors = weakref.WeakSet()
+        self._worker_lock = threading.Lock()
+
+    def refresh_env(self):
+        """Rebuild the child environment from os.environ (call after changing it)"""
+        self._exec_env = {**os.environ, 'SUDO_ASKPASS': '/bin/false'}  # Prevent GUI password prompts
+
+    @property
+    def password_manager(self) -> ThreadSafePasswordManager:
+        """Shared password manager, created on first access"""
+        if self._password_manager is None:
+            self._password_manager = ThreadSafePasswordManager.instance()
+        return self._password_manager
 
     def is_command_safe(self, command: str) -> bool:
         """Enhanced Command Safety Check with detailed logging"""
@@ -374,57 +752,41 @@ class FixedCommandExecutor(QObject):
         """Filter sudo password prompts from stderr"""
         if not stderr:
             return stderr
-        
-        # Common sudo prompts to filter out
-        sudo_prompts = [
-            '[sudo] password for',
-            'Password:',
-            'Enter password:',
-            'Sorry, try again.',
-            'sudo: 3 incorrect password',
-            'sudo: a terminal is required',
-            'sudo: a password is required'
-        ]
-        
-        lines = stderr.split('\n')
-        filtered_lines = []
-        
-        for line in lines:
-            # Check if line is a sudo prompt
-            is_sudo_prompt = any(prompt in line for prompt in sudo_prompts)
-            
-            if not is_sudo_prompt and line.strip():
-                filtered_lines.append(line)
-        
-        return '\n'.join(filtered_lines)
 
-    def prepare_command_with_sudo(self, command: str) -> tuple:
-        """Prepare command with sudo - FIXED for proper stdin handling"""
+        # Drop prompt lines in one pass, then blank lines
+        stderr = _SUDO_PROMPT_RE.sub('', stderr)
+        return '\n'.join(line for line in stderr.split('\n') if line.strip())
+
+    def prepare_command_with_sudo(self, command: str, argv: Optional[List[str]] = None) -> tuple:
+        """Prepare command with sudo - FIXED for proper stdin handling
+
+        argv is the pre-tokenized command (e.g. ConfigItem.argv); without it the
+        command string is tokenized here.
+        """
+        if argv is None:
+            argv = self._split_command(command)
+
         # Check if sudo is needed
-        needs_sudo = command.strip().startswith('sudo')
+        needs_sudo = bool(argv) and argv[0] == 'sudo'
 
         if needs_sudo:
-            # Remove 'sudo' from beginning
-            cmd_without_sudo = command.strip()[4:].strip()
-            
+            # Replace 'sudo' with 'sudo -S' (password from stdin)
+            cmd_list = ['sudo', '-S', *argv[1:]]
+
             # Check if password is already cached and valid
-            if self.password_manager.is_password_cached_and_valid():
+            password = self.password_manager.get_cached_password()
+            if password and self.password_manager.has_sudo_timestamp():
+                # sudo authenticated recently - no password on stdin needed
+                return ['sudo', '-n', *argv[1:]], None
+
+            if password:
                 print("🔐 Using cached password - preparing -S command")
                 # Use -S even with cached password for consistency
-                cmd_list = ['sudo', '-S'] + cmd_without_sudo.split()
-                
-                # Get cached password
-                with self.password_manager._lock:
-                    password = self.password_manager.password_cache
-                
                 return cmd_list, password + '\n'
             else:
                 # Need new password
-                cmd_list = ['sudo', '-S'] + cmd_without_sudo.split()
-                
                 # Get password using thread-safe manager
-                import uuid
-                request_id = str(uuid.uuid4())
+                request_id = self.password_manager.new_request_id()
                 password = self.password_manager.request_password(request_id)
 
                 if not password:
@@ -432,10 +794,44 @@ class FixedCommandExecutor(QObject):
 
                 return cmd_list, password + '\n'
         else:
-            return command.split(), None
+            return list(argv), None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _split_command(command: str) -> Tuple[str, ...]:
+        """Tokenize a command like a shell would (quoted arguments stay together)
+
+        Cached per command string, so the result is an immutable tuple.
+        """
+        try:
+            return tuple(shlex.split(command))
+        except ValueError:
+            # Unbalanced quotes - fall back to plain whitespace splitting
+            return tuple(command.split())
+
+    def _is_sudo_auth_failure(self, stderr: str, return_code: Optional[int]) -> bool:
+        """Check whether sudo itself rejected the password
+
+        Only the lines sudo prints before the command starts are inspected:
+        the first line that is neither a sudo prompt nor a sudo rejection
+        comes from the command, so authentication succeeded.
+        """
+        if return_code == 0:
+            return False
 
-    def execute_command(self, command: str, use_sudo: bool = True, timeout: int = 300) -> CommandResult:
-        """Execute command with enhanced security and FIXED sudo handling"""
+        for line in stderr.splitlines():
+            line = line.strip()
+            if not line or _SUDO_AUTH_PROMPT_RE.fullmatch(line):
+                continue
+            return _SUDO_AUTH_FAILURE_RE.fullmatch(line) is not None
+        return False
+
+    def execute_command(self, command: str, use_sudo: bool = True, timeout: int = 300,
+                        argv: Optional[List[str]] = None) -> CommandResult:
+        """Execute command with enhanced security and FIXED sudo handling
+
+        argv may carry the already tokenized command to skip re-tokenizing.
+        """
         start_time = time.time()
 
         # Enhanced safety check
@@ -450,7 +846,7 @@ class FixedCommandExecutor(QObject):
             )
 
         # Check Pacman lock for pacman commands
-        if 'pacman' in command.lower():
+        if 'pacman' in command:  # binary name is always lowercase
             if self.check_pacman_lock():
                 return CommandResult(
                     command=command,
@@ -462,7 +858,7 @@ class FixedCommandExecutor(QObject):
                 )
 
         # Prepare command with improved sudo handling
-        cmd_result = self.prepare_command_with_sudo(command)
+        cmd_result = self.prepare_command_with_sudo(command, argv)
         if cmd_result[0] is None:
             return CommandResult(
                 command=command,
@@ -484,72 +880,41 @@ class FixedCommandExecutor(QObject):
             self.is_running = True
             self.should_cancel = False
 
-            # Start process with proper environment
-            env = os.environ.copy()
-            env['SUDO_ASKPASS'] = '/bin/false'  # Prevent GUI password prompts
-            
-            self.current_process = subprocess.Popen(
-                cmd_list,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                env=env,
-                preexec_fn=os.setsid if os.name != 'nt' else None
-            )
-
-            # Send password IMMEDIATELY if needed
-            if password_input:
-                try:
-                    print("🔑 Sending password to sudo...")
-                    self.current_process.stdin.write(password_input)
-                    self.current_process.stdin.flush()
-                    # Keep stdin open for potential additional input
-                    print("✅ Password sent successfully")
-                except Exception as e:
-                    print(f"❌ Error sending password: {e}")
-                    return CommandResult(
-                        command=command,
-                        status=CommandStatus.FAILED,
-                        return_code=-1,
-                        stdout="",
-                        stderr=f"Failed to send password: {e}",
-                        execution_time=time.time() - start_time
-                    )
-
-            # Read output with timeout handling
-            try:
-                stdout, stderr = self.current_process.communicate(timeout=timeout)
-            except subprocess.TimeoutExpired:
-                print("⏰ Command timed out, terminating...")
-                self.terminate_process()
-                stdout, stderr = self.current_process.communicate()
-                
+            # Start process with proper environment (prepared once, see refresh_env)
+            return_code, stdout, stderr = self._run_process(cmd_list, self._exec_env, password_input, timeout)
+
+            # sudo's timestamp ran out before ours - rerun once with the cached password
+            # ('sudo -n' fails before running anything, so the retry is safe)
+            if (cmd_list[:2] == ['sudo', '-n'] and return_code
+                    and self._is_sudo_auth_failure(stderr, return_code)):
+                self.password_manager.expire_sudo_timestamp()
+                password = self.password_manager.get_cached_password()
+                if password and not self.should_cancel:
+                    print("🔐 Sudo timestamp expired, retrying with password")
+                    cmd_list, password_input = ['sudo', '-S', *cmd_list[2:]], password + '\n'
+                    return_code, stdout, stderr = self._run_process(cmd_list, self._exec_env, password_input, timeout)
+
+            if return_code is None:
                 return CommandResult(
                     command=command,
                     status=CommandStatus.FAILED,
                     return_code=-1,
-                    stdout=stdout or "",
-                    stderr=(stderr or "") + "\nCommand timed out",
+                    stdout=stdout,
+                    stderr=self.filter_sudo_prompts(stderr) + "\nCommand timed out",
                     execution_time=time.time() - start_time
                 )
 
-            return_code = self.current_process.returncode
+            if cmd_list[0] == 'sudo':
+                if not self._is_sudo_auth_failure(stderr, return_code):
+                    # sudo authenticated, so its timestamp was refreshed
+                    self.password_manager.mark_sudo_timestamp()
+                elif password_input:
+                    # Cached password was rejected - drop it and force a new prompt
+                    print("❌ Sudo rejected the cached password")
+                    self.password_manager.invalidate_cache()
 
             # Filter stderr to remove sudo prompts
-            filtered_stderr = self.filter_sudo_prompts(stderr or "")
-
-            # Emit real-time output (filtered)
-            if stdout:
-                self.output_received.emit('stdout', stdout)
-                if self.output_callback:
-                    self.output_callback('stdout', stdout)
-
-            if filtered_stderr:
-                self.output_received.emit('stderr', filtered_stderr)
-                if self.output_callback:
-                    self.output_callback('stderr', filtered_stderr)
+            filtered_stderr = self.filter_sudo_prompts(stderr)
 
             # Determine status
             if self.should_cancel:
@@ -564,7 +929,7 @@ class FixedCommandExecutor(QObject):
                 command=command,
                 status=status,
                 return_code=return_code,
-                stdout=stdout or "",
+                stdout=stdout,
                 stderr=filtered_stderr,
                 execution_time=time.time() - start_time
             )
@@ -592,47 +957,281 @@ class FixedCommandExecutor(QObject):
             self.is_running = False
             self.current_process = None
 
+    def _run_process(self, cmd_list: List[str], env: dict, password_input: Optional[str],
+                     timeout: float) -> Tuple[Optional[int], str, str]:
+        """Run a prepared command and collect its output
+
+        Returns (return_code, stdout, stderr); return_code is None on timeout.
+        """
+        self.current_process = subprocess.Popen(
+            cmd_list,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            bufsize=0,  # raw pipes - output is decoded once per line/result
+            env=env,
+            preexec_fn=os.setsid if os.name != 'nt' else None
+        )
+        self._grow_pipe_buffers(self.current_process)
+
+        # Send password IMMEDIATELY if needed
+        if password_input:
+            try:
+                print("🔑 Sending password to sudo...")
+                self.current_process.stdin.write(password_input.encode())
+                self.current_process.stdin.flush()
+                print("✅ Password sent successfully")
+            except Exception as e:
+                print(f"❌ Error sending password: {e}")
+                raise RuntimeError(f"Failed to send password: {e}")
+
+        # Close stdin so interactive prompts see EOF instead of hanging
+        try:
+            self.current_process.stdin.close()
+        except Exception:
+            pass
+
+        # Stream output as it arrives (woken only when a pipe is readable)
+        stdout, stderr, timed_out = self._read_process_output(self.current_process, timeout)
+
+        if timed_out:
+            print("⏰ Command timed out, terminating...")
+            self.terminate_process()
+            return None, stdout, stderr
+
+        return self.current_process.wait(), stdout, stderr
+
+    def _grow_pipe_buffers(self, process: subprocess.Popen):
+        """Enlarge the output pipes so bursts (e.g. makepkg) don't block the child"""
+        if fcntl is None or not hasattr(fcntl, 'F_SETPIPE_SZ'):
+            return
+
+        for pipe in (process.stdout, process.stderr):
+            try:
+                fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, self.PIPE_BUFFER_SIZE)
+            except OSError:
+                # Above /proc/sys/fs/pipe-max-size for unprivileged users - keep default
+                pass
+
+    def _read_process_output(self, process: subprocess.Popen, timeout: float) -> Tuple[str, str, bool]:
+        """Read stdout/stderr with a selector loop, emitting complete lines as they arrive
+
+        Returns (stdout, stderr, timed_out).
+        """
+        # Raw output accumulates in one growing buffer per stream and is
+        # decoded once at the end; emitted tracks the last forwarded line end
+        buffers = {'stdout': bytearray(), 'stderr': bytearray()}
+        emitted = {'stdout': 0, 'stderr': 0}
+        deadline = time.monotonic() + timeout
+        timed_out = False
+
+        # A pidfd makes process exit a selector event, so the loop sleeps until
+        # output arrives or the process ends instead of ticking every second
+        pidfd = self._open_pidfd(process)
+        exited = False
+        open_pipes = 0
+
+        with selectors.DefaultSelector() as sel:
+            for output_type, pipe in (('stdout', process.stdout), ('stderr', process.stderr)):
+                os.set_blocking(pipe.fileno(), False)
+                sel.register(pipe.fileno(), selectors.EVENT_READ, output_type)
+                open_pipes += 1
+            if pidfd is not None:
+                sel.register(pidfd, selectors.EVENT_READ, None)
+
+            try:
+                while open_pipes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+
+                    if exited:
+                        # Only collect what is left in the pipes
+                        wait = min(0.1, remaining)
+                    elif pidfd is not None:
+                        wait = remaining
+                    else:
+                        wait = min(1.0, remaining)
+                    if self._pending_output['stdout'] or self._pending_output['stderr']:
+                        # Wake up in time to hand buffered lines to the GUI
+                        wait = min(wait, self.OUTPUT_FLUSH_INTERVAL)
+
+                    events = sel.select(timeout=wait)
+                    self._flush_output_if_due()
+                    if not events:
+                        # Process gone but a child may still hold the pipe open
+                        if exited or process.poll() is not None:
+                            break
+                        continue
+
+                    for key, _ in events:
+                        if key.data is None:
+                            sel.unregister(key.fd)
+                            exited = True
+                        elif not self._drain_pipe(key.fd, buffers, emitted, key.data):
+                            sel.unregister(key.fd)
+                            open_pipes -= 1
+            finally:
+                if pidfd is not None:
+                    os.close(pidfd)
+
+        return self._finish_output(buffers, emitted) + (timed_out,)
+
+    @staticmethod
+    def _open_pidfd(process: subprocess.Popen) -> Optional[int]:
+        """Open a pidfd for the process (Linux 5.3+), None if unsupported"""
+        if not hasattr(os, 'pidfd_open'):
+            return None
+
+        try:
+            return os.pidfd_open(process.pid)
+        except OSError:
+            return None
+
+    def _drain_pipe(self, fd: int, buffers: dict, emitted: dict, output_type: str) -> bool:
+        """Read a ready pipe, returns False on EOF
+
+        A read that fills the whole chunk means more data is likely waiting,
+        so keep reading instead of going back through select() for every chunk.
+        """
+        while True:
+            try:
+                chunk = os.read(fd, self.READ_CHUNK_SIZE)
+            except BlockingIOError:
+                return True
+
+            if not chunk:
+                return False
+
+            self._consume_output(buffers, emitted, output_type, chunk)
+            if len(chunk) < self.READ_CHUNK_SIZE:
+                return True
+
+    def _consume_output(self, buffers: dict, emitted: dict, output_type: str, chunk: bytes):
+        """Append a raw chunk and forward the lines it completes"""
+        buf = buffers[output_type]
+        buf.extend(chunk)
+
+        # Walk newlines with find() (memchr) from the first unforwarded byte
+        start = emitted[output_type]
+        newline = buf.find(b'\n', start)
+        while newline != -1:
+            self._emit_line(output_type, buf[start:newline].decode('utf-8', 'replace'))
+            start = newline + 1
+            newline = buf.find(b'\n', start)
+        emitted[output_type] = start
+
+    def _finish_output(self, buffers: dict, emitted: dict) -> Tuple[str, str]:
+        """Forward trailing output without a final newline and decode both streams"""
+        for output_type, buf in buffers.items():
+            if emitted[output_type] < len(buf):
+                self._emit_line(output_type, buf[emitted[output_type]:].decode('utf-8', 'replace'))
+        self._flush_output()
+
+        return buffers['stdout'].decode('utf-8', 'replace'), buffers['stderr'].decode('utf-8', 'replace')
+
+    def _emit_line(self, output_type: str, line: str):
+        """Forward an output line (sudo prompts are not forwarded)"""
+        if not line.strip():
+            return
+        # Single line: one match instead of filter_sudo_prompts' sub/split/join
+        if output_type == 'stderr' and _SUDO_PROMPT_RE.match(line):
+            return
+
+        if self.output_callback:
+            self.output_callback(output_type, line)
+
+        self._pending_output[output_type].append(line)
+        self._flush_output_if_due()
+
+    def _flush_output_if_due(self):
+        """Flush batched output once the flush interval has passed"""
+        if time.monotonic() - self._output_flushed_at >= self.OUTPUT_FLUSH_INTERVAL:
+            self._flush_output()
+
+    def _flush_output(self):
+        """Emit all batched lines, one output_received signal per stream"""
+        for output_type, lines in self._pending_output.items():
+            if lines:
+                self.output_received.emit(output_type, '\n'.join(lines))
+                lines.clear()
+        self._output_flushed_at = time.monotonic()
+
     def check_pacman_lock(self) -> bool:
         """Check if Pacman is locked"""
-        lock_file = "/var/lib/pacman/db.lck"
-        return os.path.exists(lock_file)
+        watcher = self._pacman_lock_watcher
+        if watcher is not None and watcher.active:
+            return watcher.locked
+
+        # No inotify watch: reuse a fresh stat result for the rest of a batch
+        now = time.monotonic()
+        if now - self._lock_checked_at >= self.LOCK_CHECK_TTL:
+            self._lock_state = os.path.exists("/var/lib/pacman/db.lck")
+            self._lock_checked_at = now
+        return self._lock_state
 
     def terminate_process(self):
         """Proper process termination"""
-        if self.current_process:
+        process = self.current_process
+        if process:
             try:
                 if os.name != 'nt':
                     # Linux/Unix: Terminate process group
-                    os.killpg(os.getpgid(self.current_process.pid), signal.SIGTERM)
-                    time.sleep(1)
-                    if self.current_process.poll() is None:
-                        os.killpg(os.getpgid(self.current_process.pid), signal.SIGKILL)
+                    pgid = os.getpgid(process.pid)
+                    os.killpg(pgid, signal.SIGTERM)
+                    # Returns as soon as the process exits instead of always sleeping
+                    try:
+                        process.wait(timeout=1)
+                    except subprocess.TimeoutExpired:
+                        os.killpg(pgid, signal.SIGKILL)
+                        process.wait(timeout=1)
                 else:
                     # Windows
-                    self.current_process.terminate()
-                    time.sleep(1)
-                    if self.current_process.poll() is None:
-                        self.current_process.kill()
+                    process.terminate()
+                    try:
+                        process.wait(timeout=1)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.wait(timeout=1)
             except Exception as e:
                 print(f"Error terminating process: {e}")
 
+    def spawn_worker_executor(self) -> 'FixedCommandExecutor':
+        """Executor for another thread (each executor tracks one process at a time)
+
+        Its output is forwarded through this executor's output_received, and
+        cancel_current_command() here cancels its command as well.
+        """
+        worker = type(self)(self.output_callback)
+        worker.output_received.connect(self.output_received)
+        with self._worker_lock:
+            self._worker_executors.add(worker)
+        return worker
+
     def cancel_current_command(self):
-        """Cancel the currently running command"""
+        """Cancel the currently running command (including worker executors)"""
         if self.is_running:
             self.should_cancel = True
             self.terminate_process()
 
+        with self._worker_lock:
+            workers = list(self._worker_executors)
+        for worker in workers:
+            worker.cancel_current_command()
+
     def reset_sudo_cache(self):
         """Reset cached sudo password"""
         self.password_manager.invalidate_cache()
 
     def get_password_cache_status(self) -> dict:
         """Get password cache status for debugging"""
+        password, valid_until = self.password_manager._cache_state
         return {
-            'cached': bool(self.password_manager.password_cache),
+            'cached': bool(password),
             'valid': self.password_manager.is_password_cached_and_valid(),
             'attempts': self.password_manager.password_attempts,
-            'expires_in': max(0, self.password_manager.password_valid_until - time.time()) if self.password_manager.password_cache else 0
+            'expires_in': max(0, valid_until - time.time()) if password else 0
         }
 
 
@@ -643,64 +1242,298 @@ class SafeCommandExecutionThread(QThread):
     command_finished = pyqtSignal(object)   # result list
     output_received = pyqtSignal(str, str)   # type, text
 
+    PROGRESS_INTERVAL = 0.05  # seconds between progress updates with the same percentage
+    MAX_PARALLEL = 4  # worker threads for independent (non-sudo, non-pacman) tools
+
+    # Commands containing these share the pacman database lock
+    PACKAGE_DB_COMMANDS = ('pacman', 'yay', 'paru', 'makepkg')
+
+    # 'pacman -S' flags that take no value; installs using any other flag are not merged
+    MERGEABLE_PACMAN_FLAGS = frozenset({
+        '--noconfirm', '--needed', '--asdeps', '--asexplicit',
+        '--noprogressbar', '--disable-download-timeout',
+        '-q', '--quiet', '-v', '--verbose',
+    })
+
     def __init__(self, tools_list, command_executor):
         super().__init__()
         self.tools_list = tools_list
         self.command_executor = command_executor
         self.results = []
+        self._slots = []  # one result per tool position, filled as tools finish
+        self._last_progress = (-1, 0.0)  # (percentage, monotonic time) of the last emit
+
+        # Tool positions/progress are shared between this thread and the workers
+        self._progress_lock = threading.Lock()
+        self._total = 0
+        self._started = 0
+        self._worker_state = threading.local()
 
     def run(self):
         """Execute tools in background thread safely"""
-        total = len(self.tools_list)
-        print(f"🚀 Starting batch execution of {total} tools")
+        self._run_batch(self.tools_list)
 
-        for i, tool in enumerate(self.tools_list):
-            progress = int((i / total) * 100)
-            self.progress_updated.emit(progress, f"Executing: {tool.name}")
+    def _run_batch(self, tools_list):
+        """Execute one batch of tools and emit command_finished with its results
 
-            try:
-                print(f"🔧 [{i+1}/{total}] Executing: {tool.name}")
-                result = self.command_executor.execute_command(tool.command)
-                
-                success = result.status.value == "success"
-                print(f"{'✅' if success else '❌'} [{i+1}/{total}] {tool.name} -> {result.status.value}")
-                
-                self.results.append({
-                    'tool': tool,
-                    'result': result,
-                    'success': success
-                })
-
-                # Emit output (filtered for sudo prompts)
-                if result.stdout:
-                    self.output_received.emit('stdout', result.stdout)
-                if result.stderr and result.stderr.strip():
-                    # Additional filtering for stderr
-                    filtered_stderr = self.command_executor.filter_sudo_prompts(result.stderr)
-                    if filtered_stderr.strip():
-                        self.output_received.emit('stderr', filtered_stderr)
+        Tools run in the selected order. Only a run of adjacent tools that
+        neither need sudo nor touch the package database goes to a small
+        worker pool, after every tool before it has finished. Results keep
+        the selected order.
+        """
+        total = len(tools_list)
+        print(f"🚀 Starting batch execution of {total} tools")
 
-            except Exception as e:
-                error_msg = f"Failed to execute {tool.name}: {str(e)}"
-                print(f"❌ {error_msg}")
-                
-                self.results.append({
-                    'tool': tool,
-                    'result': None,
-                    'success': False,
-                    'error': str(e)
-                })
-                
-                # Emit error as stderr
-                self.output_received.emit('stderr', error_msg)
+        self.tools_list = tools_list
+        self.results = []
+        self._slots = [None] * total
+        self._last_progress = (-1, 0.0)
+        self._total = total
+        self._started = 0
 
-        self.progress_updated.emit(100, "Completed")
+        try:
+            for independent, tools in self._segment_tools(tools_list):
+                if independent and len(tools) > 1:
+                    self._run_parallel(tools)
+                else:
+                    self._run_serial(tools)
+        finally:
+            self.results = [result for result in self._slots if result is not None]
+
+        self._emit_progress(100, "Completed", force=True)
         self.command_finished.emit(self.results)
         
         # Summary
-        success_count = sum(1 for r in self.results if r['success'])
+        success_count = sum(1 for r in self.results if r.success)
         print(f"🎯 Batch execution completed: {success_count}/{total} successful")
 
+    def _run_serial(self, tools):
+        """Run tools one after another, merging adjacent pacman installs"""
+        total = self._total
+        for flags, group in self._group_tools(tools):
+            if len(group) > 1:
+                names = ", ".join(tool.name for tool in group)
+                position = self._begin(len(group), f"Executing: {names}")
+                print(f"📦 [{position}-{position+len(group)-1}/{total}] Installing in one transaction: {names}")
+
+                result = self._execute_merged(flags, group)
+                if result is not None:
+                    for offset, tool in enumerate(group):
+                        self._record_result(tool, result, position + offset, total)
+                    continue
+
+                # Merged transaction failed - run each tool on its own
+                print("⚠️ Batched pacman transaction failed, retrying tools individually")
+                for offset, tool in enumerate(group):
+                    with self._progress_lock:
+                        self._emit_progress(int((position - 1 + offset) / total * 100), f"Executing: {tool.name}")
+                    self._execute_tool(tool, position + offset, total)
+                continue
+
+            tool = group[0]
+            position = self._begin(1, f"Executing: {tool.name}")
+            self._execute_tool(tool, position, total)
+
+    def _run_parallel(self, tools):
+        """Run adjacent independent tools on the worker pool and wait for all of them"""
+        # Every earlier tool has finished, so positions follow on from here
+        first = self._started + 1
+
+        # Installs wait on downloads, not CPU - don't scale with core count
+        workers = min(self.MAX_PARALLEL, len(tools))
+        print(f"⚡ Running {len(tools)} independent tools on {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._execute_parallel_tool, tool, first + offset)
+                for offset, tool in enumerate(tools)
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def _execute_parallel_tool(self, tool, position: int):
+        """Worker pool entry point for an independent tool"""
+        self._begin(1, f"Executing: {tool.name}")
+        self._execute_tool(tool, position, self._total, self._worker_executor())
+
+    def _worker_executor(self) -> FixedCommandExecutor:
+        """Executor for the current worker thread (executors track one process at a time)"""
+        executor = getattr(self._worker_state, 'executor', None)
+        if executor is None:
+            executor = self.command_executor.spawn_worker_executor()
+            self._worker_state.executor = executor
+        return executor
+
+    def _begin(self, count: int, status: str) -> int:
+        """Reserve positions for count tools and report progress, returns the first position"""
+        with self._progress_lock:
+            position = self._started + 1
+            self._emit_progress(int(self._started / self._total * 100), status)
+            self._started += count
+            return position
+
+    def _segment_tools(self, tools) -> List[Tuple[bool, list]]:
+        """Split tools into runs of adjacent (independent, tools), keeping their order"""
+        segments = []
+        for tool in tools:
+            independent = self._is_independent(tool)
+            if segments and segments[-1][0] == independent:
+                segments[-1][1].append(tool)
+            else:
+                segments.append((independent, [tool]))
+        return segments
+
+    @classmethod
+    def _is_independent(cls, tool) -> bool:
+        """Commands without sudo that don't touch the package database can run concurrently"""
+        argv = cls._tool_argv(tool)
+        if not argv or 'sudo' in argv:
+            return False
+        return not any(name in tool.command for name in cls.PACKAGE_DB_COMMANDS)
+
+    def _emit_progress(self, progress: int, status: str, force: bool = False):
+        """Emit progress, skipping same-percentage updates that follow in quick succession"""
+        now = time.monotonic()
+        last_progress, last_time = self._last_progress
+        if not force and progress == last_progress and now - last_time < self.PROGRESS_INTERVAL:
+            return
+
+        self._last_progress = (progress, now)
+        self.progress_updated.emit(progress, status)
+
+    @staticmethod
+    def _tool_argv(tool) -> Tuple[str, ...]:
+        """Tokenized command of a tool (quoted arguments stay together)"""
+        argv = getattr(tool, 'argv', None)
+        return tuple(argv) if argv else FixedCommandExecutor._split_command(tool.command)
+
+    @classmethod
+    def _pacman_install_flags(cls, argv: Tuple[str, ...]) -> Optional[tuple]:
+        """Return the flags of a plain 'sudo pacman -S <pkgs>' command, None for anything else"""
+        if argv[:3] != ('sudo', 'pacman', '-S') or len(argv) < 4:
+            return None
+
+        # Only plain package lists can be merged (no chained commands)
+        if any(part in ('&&', '||', '|', ';') for part in argv):
+            return None
+
+        flags = tuple(part for part in argv[3:] if part.startswith('-'))
+
+        # A flag with a value (--overwrite, --ignore, --config ...) would turn
+        # that value into a package name - such installs run on their own
+        if not cls.MERGEABLE_PACMAN_FLAGS.issuperset(flags):
+            return None
+        return flags
+
+    def _group_tools(self, tools) -> List[Tuple[Optional[tuple], list]]:
+        """Bucket adjacent pacman installs with identical flags, keep everything else single"""
+        groups = []
+        for tool in tools:
+            flags = self._pacman_install_flags(self._tool_argv(tool))
+            if flags is not None and groups and groups[-1][0] == flags:
+                groups[-1][1].append(tool)
+            else:
+                groups.append((flags, [tool]))
+        return groups
+
+    def _execute_merged(self, flags: tuple, group: list) -> Optional[CommandResult]:
+        """Install the packages of several tools with a single pacman invocation"""
+        packages = []
+        for tool in group:
+            for part in self._tool_argv(tool)[3:]:
+                if not part.startswith('-') and part not in packages:
+                    packages.append(part)
+
+        argv = ['sudo', 'pacman', '-S', *flags, *packages]
+        command = shlex.join(argv)
+
+        try:
+            result = self.command_executor.execute_command(command, argv=argv)
+        except Exception as e:
+            print(f"❌ Batched execution failed: {e}")
+            return None
+
+        # Cancelled, locked or missing password apply to every tool alike
+        if result.status == CommandStatus.FAILED:
+            return None
+
+        self._emit_result_output(result)
+        return result
+
+    def _execute_tool(self, tool, position: int, total: int,
+                      executor: Optional[FixedCommandExecutor] = None):
+        """Execute a single tool and record its result"""
+        executor = executor or self.command_executor
+        try:
+            print(f"🔧 [{position}/{total}] Executing: {tool.name}")
+            result = executor.execute_command(tool.command, argv=getattr(tool, 'argv', None))
+            self._record_result(tool, result, position, total)
+            self._emit_result_output(result)
+
+        except Exception as e:
+            error_msg = f"Failed to execute {tool.name}: {str(e)}"
+            print(f"❌ {error_msg}")
+            
+            self._slots[position - 1] = BatchResult(tool, None, False, str(e))
+            
+            # Emit error as stderr
+            self.output_received.emit('stderr', error_msg)
+
+    def _record_result(self, tool, result: CommandResult, position: int, total: int):
+        """Store the result of a tool"""
+        success = result.status.value == "success"
+        print(f"{'✅' if success else '❌'} [{position}/{total}] {tool.name} -> {result.status.value}")
+
+        self._slots[position - 1] = BatchResult(tool, result, success, None)
+
+    def _emit_result_output(self, result: CommandResult):
+        """Emit output (execute_command already filtered sudo prompts from stderr)"""
+        if result.stdout:
+            self.output_received.emit('stdout', result.stdout)
+        if result.stderr and result.stderr.strip():
+            self.output_received.emit('stderr', result.stderr)
+
+
+class PersistentExecutionWorker(SafeCommandExecutionThread):
+    """Long-lived execution thread that runs submitted tool batches one after another
+
+    Signals are connected once; submitting a batch is a queue put instead of
+    starting a new QThread per execution.
+    """
+
+    def __init__(self, command_executor):
+        super().__init__([], command_executor)
+        self._jobs = queue.Queue()
+        self._busy = False
+
+    def submit(self, tools_list):
+        """Queue a batch of tools for execution"""
+        self._jobs.put(list(tools_list))
+
+    def is_busy(self) -> bool:
+        """True while a batch is running or waiting in the queue"""
+        return self._busy or not self._jobs.empty()
+
+    def stop(self, timeout_ms: int = 3000) -> bool:
+        """Let the worker finish its current batch and exit"""
+        self._jobs.put(None)
+        return self.wait(timeout_ms)
+
+    def run(self):
+        """Process queued batches until stop() is called"""
+        while True:
+            tools_list = self._jobs.get()
+            if tools_list is None:
+                break
+
+            self._busy = True
+            try:
+                self._run_batch(tools_list)
+            except Exception as e:
+                print(f"❌ Batch execution failed: {e}")
+                self.command_finished.emit(self.results)
+            finally:
+                self._busy = False
+
 
 # Compatibility aliases for existing code
 CommandExecutor = FixedCommandExecutor
@@ -708,6 +1541,8 @@ PasswordManager = ThreadSafePasswordManager
 
 # Export classes
 __all__ = [
-    'FixedCommandExecutor', 'CommandExecutor', 'CommandResult', 'CommandStatus',
-    'SafeCommandExecutionThread', 'ThreadSafePasswordManager', 'PasswordManager', 'CommandSecurity'
+    'FixedCommandExecutor', 'CommandExecutor', 'CommandResult', 'BatchResult',
+    'CommandStatus',
+    'SafeCommandExecutionThread', 'PersistentExecutionWorker', 'ThreadSafePasswordManager', 'PasswordManager', 'CommandSecurity',
+    'PacmanLockWatcher'
 ]
@@ -4,14 +4,31 @@ Handles GitHub config download and local caching
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import yaml
 import hashlib
-from typing import Dict, List, Optional
+import json
+import pickle
+import shlex
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from operator import attrgetter
+from datetime import timedelta
 
-@dataclass
+# libyaml-backed loader when available (much faster than the pure-Python one)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# __slots__ for the config dataclasses where supported (dataclass slots= needs Python 3.10)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ConfigItem:
     """Single configuration item"""
     name: str
@@ -20,14 +37,23 @@ class ConfigItem:
     category: str = ""
     tags: List[str] = None
     requires: List[str] = None
+    argv: List[str] = None  # command tokenized once at load time
+    command_preview: str = ""  # command shortened for tool cards
 
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
         if self.requires is None:
             self.requires = []
-
-@dataclass
+        if self.argv is None:
+            try:
+                self.argv = shlex.split(self.command)
+            except ValueError:
+                self.argv = self.command.split()
+        if not self.command_preview:
+            self.command_preview = self.command if len(self.command) <= 70 else self.command[:67] + "..."
+
+@dataclass(**_DATACLASS_SLOTS)
 class ConfigCategory:
     """Configuration category with items"""
     id: str
@@ -42,6 +68,9 @@ class ConfigCategory:
             self.items = []
 
 class ConfigManager:
+    PARSED_CACHE_VERSION = 4  # bump when ConfigItem/ConfigCategory change
+    SEARCH_CACHE_SIZE = 256  # remembered queries per config
+
     def __init__(self, github_url: str = None, cache_path: str = "data/config_cache.yaml"):
         self.github_url = github_url or "https://raw.githubusercontent.com/tobayashi-san/arch-appcenter/refs/heads/main/config.yaml"
         self.cache_path = cache_path
@@ -52,39 +81,128 @@ class ConfigManager:
 
         self.config_data: Dict[str, ConfigCategory] = {}
 
+        # Parsed categories are pickled next to the YAML cache, keyed by its content hash
+        self.parsed_cache_path = cache_path + ".pkl"
+        self.meta_path = cache_path + ".meta"  # ETag/Last-Modified of the cached download
+        self.content_digest: Optional[str] = None
+
+        # Categories ordered by 'order', re-sorted only when config_data is replaced
+        self._sorted_categories: List[ConfigCategory] = []
+        self._sorted_categories_source: Optional[Dict[str, ConfigCategory]] = None
+
+        # Lowercased search fields, rebuilt whenever config_data is replaced
+        self._search_index: List[Tuple[ConfigItem, str, str, Tuple[str, ...]]] = []
+        self._trigram_index: Dict[str, Set[int]] = {}  # 3-gram -> positions in _search_index
+        self._search_index_source: Optional[Dict[str, ConfigCategory]] = None
+        self._search_cache: Dict[str, List[int]] = {}  # lowercased query -> matching positions
+
+        # HTTP session (keep-alive + retries), created on first download
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def cache_max_age(self) -> timedelta:
+        """Maximum age of the cached config before a re-download"""
+        return timedelta(seconds=self._cache_max_age_sec)
+
+    @cache_max_age.setter
+    def cache_max_age(self, max_age: timedelta):
+        # Kept as float seconds so is_cache_valid() is plain float math
+        self._cache_max_age_sec = max_age.total_seconds()
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session with retries for transient server errors"""
+        if self._session is None:
+            session = requests.Session()
+            session.headers.update({'User-Agent': 'Arch-Config-Tool/2.0'})
+            adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=4,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+
     def is_cache_valid(self) -> bool:
         """Check if cached config is still valid"""
-        if not os.path.exists(self.cache_path):
+        try:
+            cache_mtime = os.stat(self.cache_path).st_mtime
+        except OSError:
             return False
 
+        return time.time() - cache_mtime < self._cache_max_age_sec
+
+    def load_cache_meta(self) -> dict:
+        """Load HTTP validators stored with the cached config"""
         try:
-            cache_mtime = datetime.fromtimestamp(os.path.getmtime(self.cache_path))
-            return datetime.now() - cache_mtime < self.cache_max_age
-        except:
-            return False
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            return meta if isinstance(meta, dict) else {}
+        except (OSError, ValueError):
+            return {}
 
-    def download_config(self) -> Optional[str]:
-        """Download configuration from GitHub"""
+    def save_cache_meta(self, meta: dict):
+        """Store HTTP validators next to the cached config"""
+        try:
+            with open(self.meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except OSError as e:
+            print(f"⚠️ Could not write cache metadata: {e}")
+
+    def download_config(self) -> Optional[dict]:
+        """Download configuration from GitHub, returns the parsed YAML data
+
+        Returns None if the download failed or the cached copy is unchanged
+        (304, or a body with the same content hash); the cache is used then.
+        """
         print(f"📥 Downloading config from GitHub...")
 
         try:
-            headers = {'User-Agent': 'Arch-Config-Tool/2.0'}
-            response = requests.get(self.github_url, headers=headers, timeout=30)
+            # Conditional request - an unchanged config transfers no body
+            headers = {}
+            meta = self.load_cache_meta() if os.path.exists(self.cache_path) else {}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+            response = self.session.get(self.github_url, headers=headers, timeout=(5, 30))  # (connect, read)
+            if response.status_code == 304:
+                os.utime(self.cache_path)  # restart the cache max age
+                print("✅ Configuration unchanged on server")
+                return None
             response.raise_for_status()
 
             config_content = response.text
             if not config_content.strip():
                 raise ValueError("Empty configuration file")
 
-            # Validate YAML
-            yaml.safe_load(config_content)
+            # Same content as the cache (server without validators) - skip rewrite and parse
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'digest': self._digest(config_content),
+            }
+            if meta.get('digest') == validators['digest']:
+                os.utime(self.cache_path)  # restart the cache max age
+                self.save_cache_meta(validators)
+                print("✅ Configuration unchanged (same content hash)")
+                return None
+
+            # Validate YAML (the parsed data is returned, so it's parsed only once)
+            config_data = yaml.load(config_content, Loader=_YamlLoader)
+            if not isinstance(config_data, dict):
+                raise ValueError("Configuration is not a YAML mapping")
 
             # Save to cache
             with open(self.cache_path, 'w', encoding='utf-8') as f:
                 f.write(config_content)
+            self.content_digest = validators['digest']
+            self.save_cache_meta(validators)
 
             print("✅ Configuration downloaded successfully")
-            return config_content
+            return config_data
 
         except Exception as e:
             print(f"❌ Download failed: {e}")
@@ -100,10 +218,48 @@ class ConfigManager:
             print(f"❌ Cache load failed: {e}")
         return None
 
+    @staticmethod
+    def _digest(config_text: str) -> str:
+        """Content hash of a configuration text"""
+        return hashlib.blake2b(config_text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def load_parsed_cache(self, digest: str) -> Optional[Dict[str, ConfigCategory]]:
+        """Load pickled categories if they were built from content with this digest"""
+        try:
+            with open(self.parsed_cache_path, 'rb') as f:
+                version, cached_digest, categories = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Parsed config cache unreadable: {e}")
+            return None
+
+        if version != self.PARSED_CACHE_VERSION or cached_digest != digest:
+            return None
+        return categories
+
+    def save_parsed_cache(self, digest: str, categories: Dict[str, ConfigCategory]):
+        """Pickle parsed categories so the next start can skip YAML parsing"""
+        try:
+            with open(self.parsed_cache_path, 'wb') as f:
+                pickle.dump((self.PARSED_CACHE_VERSION, digest, categories), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ Could not write parsed config cache: {e}")
+
     def parse_config(self, config_text: str) -> Dict[str, ConfigCategory]:
         """Parse YAML configuration into structured data"""
         try:
-            config_data = yaml.safe_load(config_text)
+            config_data = yaml.load(config_text, Loader=_YamlLoader)
+        except Exception as e:
+            print(f"❌ Parse failed: {e}")
+            return {}
+
+        return self.parse_config_data(config_data)
+
+    def parse_config_data(self, config_data: dict) -> Dict[str, ConfigCategory]:
+        """Build categories from already loaded YAML data"""
+        try:
             if not isinstance(config_data, dict):
                 return {}
 
@@ -151,7 +307,7 @@ class ConfigManager:
                     category.items.append(config_item)
 
                 # Sort items by name
-                category.items.sort(key=lambda item: item.name)
+                category.items.sort(key=attrgetter('name'))
                 categories[category_id] = category
 
             print(f"✅ Parsed {len(categories)} categories with {sum(len(cat.items) for cat in categories.values())} tools")
@@ -163,19 +319,30 @@ class ConfigManager:
 
     def get_config(self, force_update: bool = False) -> Dict[str, ConfigCategory]:
         """Get configuration (from cache or download)"""
-        config_content = None
-
-        # Check if update is needed
+        # Check if update is needed (a download is already parsed)
         if force_update or not self.is_cache_valid():
-            config_content = self.download_config()
+            downloaded = self.download_config()
+            if downloaded is not None:
+                self.config_data = self.parse_config_data(downloaded)
+                if self.config_data:
+                    self.save_parsed_cache(self.content_digest, self.config_data)
+                return self.config_data
 
-        # Fallback to cache if download failed
-        if not config_content:
-            config_content = self.load_cached_config()
+        # Fallback to cache if download failed or the config is unchanged
+        config_content = self.load_cached_config()
 
-        # Parse configuration
+        # Parse configuration (or reuse the pickled result for unchanged content)
         if config_content:
+            self.content_digest = self._digest(config_content)
+            categories = self.load_parsed_cache(self.content_digest)
+            if categories is not None:
+                print(f"✅ Loaded {len(categories)} categories from parsed cache")
+                self.config_data = categories
+                return self.config_data
+
             self.config_data = self.parse_config(config_content)
+            if self.config_data:
+                self.save_parsed_cache(self.content_digest, self.config_data)
             return self.config_data
         else:
             print("❌ No configuration available!")
@@ -186,9 +353,10 @@ class ConfigManager:
         if not self.config_data:
             self.get_config()
 
-        categories = list(self.config_data.values())
-        categories.sort(key=lambda cat: cat.order)
-        return categories
+        if self._sorted_categories_source is not self.config_data:
+            self._sorted_categories = sorted(self.config_data.values(), key=attrgetter('order'))
+            self._sorted_categories_source = self.config_data
+        return list(self._sorted_categories)
 
     def get_category_items(self, category_id: str) -> List[ConfigItem]:
         """Get items for specific category"""
@@ -204,13 +372,52 @@ class ConfigManager:
             self.get_config()
 
         search_term = search_term.lower()
-        results = []
+        index = self._get_search_index()
 
-        for category in self.config_data.values():
-            for item in category.items:
-                if (search_term in item.name.lower() or
-                    search_term in item.description.lower() or
-                    any(search_term in tag.lower() for tag in item.tags)):
-                    results.append(item)
+        positions = self._search_cache.get(search_term)
+        if positions is not None:
+            return [index[position][0] for position in positions]
 
-        return results
+        if search_term[:-1] in self._search_cache:
+            # Typing one more character only narrows the previous matches
+            candidates = self._search_cache[search_term[:-1]]
+        elif len(search_term) < 3:
+            candidates = range(len(index))
+        else:
+            # Every trigram of the term must occur in the item; verify the survivors
+            postings = sorted(
+                (self._trigram_index.get(search_term[i:i + 3], ()) for i in range(len(search_term) - 2)),
+                key=len
+            )
+            candidates = sorted(set(postings[0]).intersection(*postings[1:]))
+
+        positions = []
+        for position in candidates:
+            _, name, description, tags = index[position]
+            if (search_term in name or
+                search_term in description or
+                any(search_term in tag for tag in tags)):
+                positions.append(position)
+
+        if len(self._search_cache) >= self.SEARCH_CACHE_SIZE:
+            self._search_cache.clear()
+        self._search_cache[search_term] = positions
+
+        return [index[position][0] for position in positions]
+
+    def _get_search_index(self) -> List[Tuple[ConfigItem, str, str, Tuple[str, ...]]]:
+        """Flat list of (item, name, description, tags) lowercased once per config"""
+        if self._search_index_source is not self.config_data:
+            self._search_index = [
+                (item, item.name.lower(), item.description.lower(), tuple(tag.lower() for tag in item.tags))
+                for category in self.config_data.values()
+                for item in category.items
+            ]
+            self._trigram_index = {}
+            for position, (_, name, description, tags) in enumerate(self._search_index):
+                for text in (name, description, *tags):
+                    for i in range(len(text) - 2):
+                        self._trigram_index.setdefault(text[i:i + 3], set()).add(position)
+            self._search_index_source = self.config_data
+            self._search_cache.clear()
+        return self._search_index
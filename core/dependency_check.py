@@ -6,10 +6,23 @@ Verifies that required package managers are installed
 import subprocess
 import shutil
 import os
+import shlex
+from functools import cached_property
 from typing import Dict, List, Tuple
 from PyQt6.QtWidgets import QMessageBox, QWidget
 
+# os-release ID / ID_LIKE values of Arch and Arch-based distributions
+_ARCH_IDS = frozenset({'arch', 'manjaro', 'endeavouros', 'artix'})
+
 class DependencyChecker:
+    # Tools installable from the repos, all in one pacman transaction
+    PACMAN_INSTALL = ('sudo', 'pacman', '-S', '--noconfirm')
+    PACMAN_PACKAGES = {
+        'flatpak': 'flatpak',
+        'git': 'git',
+        'reflector': 'reflector'
+    }
+
     def __init__(self, parent_widget: QWidget = None):
         self.parent_widget = parent_widget
 
@@ -28,14 +41,57 @@ class DependencyChecker:
             'git': 'Version control system'
         }
 
+        # shutil.which results, PATH is only walked once per command
+        self._which_cache: Dict[str, bool] = {}
+
+        self._os_release = self._parse_os_release()
+
     def check_command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH"""
-        return shutil.which(command) is not None
+        exists = self._which_cache.get(command)
+        if exists is None:
+            path = None if os.sep in command else self._path_executables.get(command)
+            if path is not None and os.access(path, os.X_OK):
+                exists = True
+            elif path is None and os.sep not in command:
+                exists = False
+            else:
+                # Paths and shadowed non-executable files: let shutil.which decide
+                exists = shutil.which(command) is not None
+            self._which_cache[command] = exists
+        return exists
+
+    @cached_property
+    def _path_executables(self) -> Dict[str, str]:
+        """Map of file name -> first matching path, from one scandir per PATH entry"""
+        # Earlier PATH entries win, like a shell lookup
+        executables = {}
+        for directory in dict.fromkeys(d or os.curdir for d in os.get_exec_path()):
+            for name, path in self._scan_directory(directory):
+                executables.setdefault(name, path)
+        return executables
+
+    @staticmethod
+    def _scan_directory(directory: str) -> List[Tuple[str, str]]:
+        """(name, path) of the regular files in one PATH directory"""
+        try:
+            with os.scandir(directory) as entries:
+                return [(entry.name, entry.path) for entry in entries if entry.is_file()]
+        except OSError:
+            return []
+
+    def reset_path_cache(self):
+        """Forget PATH lookups so the next check sees newly installed tools"""
+        self._which_cache.clear()
+        self.__dict__.pop('_path_executables', None)
 
     def check_dependencies(self) -> Tuple[Dict[str, bool], Dict[str, bool]]:
         """Check if required and optional dependencies are available"""
         print("🔍 Checking dependencies...")
 
+        # One fresh PATH scan per full check (the checker may be reused)
+        self.reset_path_cache()
+
         required_status = {}
         optional_status = {}
 
@@ -73,36 +129,34 @@ class DependencyChecker:
 
         print(f"\n📦 Installing missing dependencies: {', '.join(missing)}")
 
-        install_commands = {
-            'flatpak': 'sudo pacman -S --noconfirm flatpak',
-            'git': 'sudo pacman -S --noconfirm git',
-            'reflector': 'sudo pacman -S --noconfirm reflector'
-        }
-
         success = True
-        for tool in missing:
-            if tool in install_commands:
-                try:
-                    print(f"  📥 Installing {tool}...")
-                    result = subprocess.run(
-                        install_commands[tool].split(),
-                        capture_output=True,
-                        text=True,
-                        timeout=300
-                    )
-
-                    if result.returncode == 0:
+        installable = [tool for tool in missing if tool in self.PACMAN_PACKAGES]
+        if installable:
+            try:
+                print(f"  📥 Installing {', '.join(installable)}...")
+                result = subprocess.run(
+                    [*self.PACMAN_INSTALL, *(self.PACMAN_PACKAGES[tool] for tool in installable)],
+                    capture_output=True,
+                    timeout=300
+                )
+
+                # New binaries may have appeared on PATH
+                self.reset_path_cache()
+
+                if result.returncode == 0:
+                    for tool in installable:
                         print(f"  ✅ {tool} installed successfully")
-                    else:
-                        print(f"  ❌ Failed to install {tool}: {result.stderr}")
-                        success = False
-
-                except Exception as e:
-                    print(f"  ❌ Error installing {tool}: {e}")
+                else:
+                    stderr = result.stderr.decode(errors='replace')
+                    print(f"  ❌ Failed to install {', '.join(installable)}: {stderr}")
                     success = False
 
-            elif tool == 'aur_helper':
-                self.show_aur_helper_instructions()
+            except Exception as e:
+                print(f"  ❌ Error installing {', '.join(installable)}: {e}")
+                success = False
+
+        if 'aur_helper' in missing:
+            self.show_aur_helper_instructions()
 
         return success
 
@@ -140,21 +194,34 @@ Note: Only one AUR helper is required!
                 return helper
         return None
 
+    @staticmethod
+    def _parse_os_release(path: str = '/etc/os-release') -> Dict[str, str]:
+        """Parse KEY=VALUE lines of os-release into a dict"""
+        fields = {}
+        try:
+            with open(path, 'r') as f:
+                for line in f:
+                    key, sep, value = line.strip().partition('=')
+                    if not sep or key.startswith('#'):
+                        continue
+                    try:
+                        value = ' '.join(shlex.split(value))
+                    except ValueError:
+                        value = value.strip('"\'')
+                    fields[key] = value
+        except OSError:
+            pass
+        return fields
+
     def check_arch_linux(self) -> bool:
         """Check if running on Arch Linux or Arch-based distribution"""
-        try:
-            # Check /etc/os-release
-            if os.path.exists('/etc/os-release'):
-                with open('/etc/os-release', 'r') as f:
-                    content = f.read().lower()
-                    if any(distro in content for distro in ['arch', 'manjaro', 'endeavouros', 'artix']):
-                        return True
-
-            # Check if pacman exists (strong indicator)
-            return self.check_command_exists('pacman')
-
-        except:
-            return False
+        distro_id = self._os_release.get('ID', '').lower()
+        id_like = self._os_release.get('ID_LIKE', '').lower().split()
+        if distro_id in _ARCH_IDS or any(like in _ARCH_IDS for like in id_like):
+            return True
+
+        # Check if pacman exists (strong indicator)
+        return self.check_command_exists('pacman')
 
     def run_startup_check(self) -> bool:
         """Run complete startup dependency check"""
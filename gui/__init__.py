@@ -2,24 +2,28 @@
 GUI Widgets Package - Simple Version
 """
 
-# Simple imports without dynamic loading
-try:
-    from .widgets.category_widget import CategoryWidget, ToolCard
-except ImportError as e:
-    print(f"⚠️ CategoryWidget not available: {e}")
-    CategoryWidget = None
-    ToolCard = None
+from importlib import import_module
 
-try:
-    from .widgets.status_widget import StatusWidget
-except ImportError as e:
-    print(f"⚠️ StatusWidget not available: {e}")
-    StatusWidget = None
+# Widgets are imported on first attribute access (PEP 562)
+_LAZY_WIDGETS = {
+    'CategoryWidget': '.widgets.category_widget',
+    'ToolCard': '.widgets.category_widget',
+    'StatusWidget': '.widgets.status_widget',
+    'CommandOutputWidget': '.widgets.command_output_widget',
+}
 
-try:
-    from .widgets.command_output_widget import CommandOutputWidget
-except ImportError as e:
-    print(f"⚠️ CommandOutputWidget not available: {e}")
-    CommandOutputWidget = None
+def __getattr__(name):
+    module_name = _LAZY_WIDGETS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(import_module(module_name, __name__), name)
+    except ImportError as e:
+        print(f"⚠️ {name} not available: {e}")
+        value = None
+
+    globals()[name] = value
+    return value
 
 __all__ = ['CategoryWidget', 'ToolCard', 'StatusWidget', 'CommandOutputWidget']
@@ -1,27 +1,136 @@
 """
 Main application window - FIXED
 """
+import logging
 import os
+import re
+import shutil
 import subprocess  # 👈 DIESER IMPORT FEHLTE!
+import configparser
+from collections import deque
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from xml.etree import ElementTree
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QListWidget, QListWidgetItem, QScrollArea, QLineEdit, QMessageBox,
-    QTextEdit, QSplitter, QTabWidget, QTableWidget, QTableWidgetItem,
+    QTextEdit, QSplitter, QTabWidget, QTableView, QAbstractItemView,
     QHeaderView, QProgressBar, QFrame, QStatusBar, QApplication  # 👈 QApplication auch hinzugefügt
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread, pyqtSignal as Signal
 from PyQt6.QtGui import QFont, QPixmap, QPalette, QColor
-from core.command_executor import CommandExecutor, SafeCommandExecutionThread
+from core.command_executor import CommandExecutor, PersistentExecutionWorker
 
 from gui.widgets.category_widget import CategoryWidget
 from gui.widgets.status_widget import StatusWidget
 from gui.widgets.command_output_widget import CommandOutputWidget
+from gui.widgets.history_model import HistoryTableModel
+
+logger = logging.getLogger(__name__)
+
+_STYLES_DIR = Path(__file__).resolve().parent / "styles"
+
+# XDG_CURRENT_DESKTOP entries served by each theme probe
+_KDE_DESKTOPS = frozenset({'kde'})
+_GNOME_DESKTOPS = frozenset({'gnome', 'unity', 'pantheon'})
+_XFCE_DESKTOPS = frozenset({'xfce'})
+
+# Dark colour schemes / GTK themes: anything named '*dark*' plus known dark ones without it
+_DARK_THEME_RE = re.compile(r'dark|breezetwilight|sweetkde|nocturna')
+
+
+def _theme_mode(name):
+    """'dark' or 'light' for a colour scheme / theme name"""
+    return 'dark' if _DARK_THEME_RE.search(name.lower()) else 'light'
+
+
+@lru_cache(maxsize=None)
+def _which(name):
+    """shutil.which, cached - skips probes whose tool is not installed"""
+    return shutil.which(name)
+
+
+def _run_theme_tool(name, *args):
+    """Stripped stdout of a desktop settings tool, or None if it is missing or fails"""
+    tool = _which(name)
+    if not tool:
+        return None
+    try:
+        # These tools answer in milliseconds or not at all; don't stall the UI
+        result = subprocess.run([tool, *args], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, timeout=0.3)
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except:
+        pass
+    return None
+
+
+def _mtime_ns(path):
+    """st_mtime_ns of path, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _config_home():
+    return os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+
+
+def _read_kde_color_scheme():
+    """[General] ColorScheme from the user's kdeglobals, read without kreadconfig5"""
+    try:
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        parser.optionxform = str
+        if not parser.read(os.path.join(_config_home(), "kdeglobals"), encoding="utf-8"):
+            return None
+        return parser.get("General", "ColorScheme", fallback=None)
+    except configparser.Error:
+        return None
+
+
+def _read_gnome_gtk_theme():
+    """org.gnome.desktop.interface gtk-theme via Gio, without spawning gsettings"""
+    try:
+        import gi
+        gi.require_version("Gio", "2.0")
+        from gi.repository import Gio
+    except (ImportError, ValueError):
+        return None
+
+    # Gio.Settings aborts the process on an unknown schema, so look it up first
+    source = Gio.SettingsSchemaSource.get_default()
+    if source is None or source.lookup("org.gnome.desktop.interface", True) is None:
+        return None
+    return Gio.Settings.new("org.gnome.desktop.interface").get_string("gtk-theme")
+
+
+def _read_xfce_theme_name():
+    """/Net/ThemeName from XFCE's xsettings channel file, without xfconf-query"""
+    path = os.path.join(_config_home(), "xfce4", "xfconf", "xfce-perchannel-xml", "xsettings.xml")
+    try:
+        root = ElementTree.parse(path).getroot()
+    except (OSError, ElementTree.ParseError):
+        return None
+    node = root.find("./property[@name='Net']/property[@name='ThemeName']")
+    return node.get("value") if node is not None else None
 
 
 class MainWindow(QMainWindow):
     """Überarbeitetes Hauptfenster mit einheitlichem Design"""
 
+    _system_theme = None  # detected desktop theme, shared for the process lifetime
+    _css_cache = {}  # theme -> ((styles.css mtime, theme css mtime), combined CSS)
+
+    SEARCH_DEBOUNCE_MS = 150
+    HISTORY_LIMIT = 500
+    OUTPUT_FLUSH_MS = 50       # command output is written at most once per tick...
+    OUTPUT_FLUSH_CHUNKS = 64   # ...or as soon as this many chunks are waiting
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("🔧 Arch Linux Configuration Tool v2.0")
@@ -29,10 +138,19 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(900, 800)
 
         # State management
-        self.command_history = []
+        self.command_history = deque(maxlen=self.HISTORY_LIMIT)  # oldest entries drop off
         self.current_category = None
+        self._total_tools = 0
+        self._category_widgets = {}  # category id -> CategoryWidget, reused on reselect
         self.execution_thread = None
 
+        # Command output waiting for the next UI tick
+        self._output_pending = []
+        self._output_timer = QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.setInterval(self.OUTPUT_FLUSH_MS)
+        self._output_timer.timeout.connect(self._flush_command_output)
+
         # Backend components
         self.init_backend()
 
@@ -48,212 +166,162 @@ class MainWindow(QMainWindow):
         """Initialize backend components"""
         try:
             from core.config_manager import ConfigManager
-            from core.command_executor import CommandExecutor
-            from core.dependency_check import DependencyChecker
 
             self.config_manager = ConfigManager()
             self.command_executor = CommandExecutor()
-            self.dependency_checker = DependencyChecker(self)
+            self.dependency_checker = None  # created on first "Check Dependencies"
 
             # Connect command executor signals
             self.command_executor.output_received.connect(self.on_command_output)
 
+            # One long-lived execution thread; batches are queued to it
+            self.execution_thread = PersistentExecutionWorker(self.command_executor)
+            self.execution_thread.progress_updated.connect(self.update_execution_progress)
+            self.execution_thread.command_finished.connect(self.on_execution_finished)
+            self.execution_thread.output_received.connect(self.on_command_output)
+            self.execution_thread.start()
+
         except ImportError as e:
             self.show_error(f"Backend components failed to load: {e}")
 
         self.categories = {}
+        self._tool_to_category = {}  # id(tool) -> category name
 
     def detect_system_theme(self) -> str:
-        """Erkenne System Theme - VERBESSERTE VERSION mit Debug-Output"""
-        print("🔍 Detecting system theme...")
-
+        """Erkenne System Theme - einmal pro Prozess, danach aus dem Cache"""
+        if MainWindow._system_theme is None:
+            MainWindow._system_theme = self._probe_system_theme()
+        return MainWindow._system_theme
+
+    @staticmethod
+    def invalidate_theme_cache():
+        """Forget the detected theme so the next detect_system_theme() probes again"""
+        MainWindow._system_theme = None
+
+    def _probe_system_theme(self) -> str:
+        """Erkenne System Theme - nur der Probe des laufenden Desktops"""
         try:
-            # 1. KDE Plasma
-            try:
-                print("  Checking KDE...")
-                result = subprocess.run([
-                    'kreadconfig5', '--file', 'kdeglobals',
-                    '--group', 'General', '--key', 'ColorScheme'
-                ], capture_output=True, text=True, timeout=2)
-
-                if result.returncode == 0:
-                    scheme = result.stdout.strip()
-                    print(f"  KDE ColorScheme: '{scheme}'")
-
-                    # Erweiterte Dark Theme Detection
-                    dark_schemes = [
-                        'breezedark', 'breezetwilight', 'darkbreeze',
-                        'sweetkde', 'nocturna', 'materia-dark', 'arc-dark'
-                    ]
-
-                    scheme_lower = scheme.lower()
-                    for dark_scheme in dark_schemes:
-                        if dark_scheme in scheme_lower:
-                            print(f"  ✅ Detected KDE Dark Theme: {scheme}")
-                            return 'dark'
-
-                    print(f"  ✅ Detected KDE Light Theme: {scheme}")
-                    return 'light'
-                else:
-                    print(f"  KDE detection failed: {result.stderr}")
-            except Exception as e:
-                print(f"  KDE detection error: {e}")
-
-            # 2. GNOME
-            try:
-                print("  Checking GNOME...")
-
-                # Prüfe zuerst color-scheme (GNOME 42+)
-                result = subprocess.run([
-                    'gsettings', 'get', 'org.gnome.desktop.interface', 'color-scheme'
-                ], capture_output=True, text=True, timeout=2)
-
-                if result.returncode == 0:
-                    color_scheme = result.stdout.strip().replace("'", "")
-                    print(f"  GNOME color-scheme: '{color_scheme}'")
-
-                    if 'dark' in color_scheme.lower():
-                        print(f"  ✅ Detected GNOME Dark Mode via color-scheme")
-                        return 'dark'
-
-                # Fallback: GTK Theme
-                result = subprocess.run([
-                    'gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'
-                ], capture_output=True, text=True, timeout=2)
-
-                if result.returncode == 0:
-                    theme = result.stdout.strip().replace("'", "")
-                    print(f"  GNOME GTK Theme: '{theme}'")
-
-                    # Erweiterte GNOME Dark Theme Detection
-                    dark_themes = [
-                        'adwaita-dark', 'yaru-dark', 'pop-dark',
-                        'materia-dark', 'arc-dark', 'numix-dark',
-                        'ubuntu-dark', 'elementary-dark'
-                    ]
-
-                    theme_lower = theme.lower()
-                    for dark_theme in dark_themes:
-                        if dark_theme in theme_lower:
-                            print(f"  ✅ Detected GNOME Dark Theme: {theme}")
-                            return 'dark'
-
-                    print(f"  ✅ Detected GNOME Light Theme: {theme}")
-                    return 'light'
-                else:
-                    print(f"  GNOME detection failed: {result.stderr}")
-            except Exception as e:
-                print(f"  GNOME detection error: {e}")
+            desktops = os.environ.get("XDG_CURRENT_DESKTOP", "").lower().split(":")
+            if not any(desktops):
+                # No desktop announced (e.g. startx): try every probe
+                probes = (self._probe_kde_theme, self._probe_gnome_theme, self._probe_xfce_theme)
+            else:
+                probes = [probe for names, probe in (
+                    (_KDE_DESKTOPS, self._probe_kde_theme),
+                    (_GNOME_DESKTOPS, self._probe_gnome_theme),
+                    (_XFCE_DESKTOPS, self._probe_xfce_theme),
+                ) if not names.isdisjoint(desktops)]
 
-            # 3. XFCE
-            try:
-                print("  Checking XFCE...")
-                result = subprocess.run([
-                    'xfconf-query', '-c', 'xsettings', '-p', '/Net/ThemeName'
-                ], capture_output=True, text=True, timeout=2)
-
-                if result.returncode == 0:
-                    theme = result.stdout.strip()
-                    print(f"  XFCE Theme: '{theme}'")
-
-                    theme_lower = theme.lower()
-                    if 'dark' in theme_lower:
-                        print(f"  ✅ Detected XFCE Dark Theme: {theme}")
-                        return 'dark'
-
-                    print(f"  ✅ Detected XFCE Light Theme: {theme}")
-                    return 'light'
-                else:
-                    print(f"  XFCE detection failed: {result.stderr}")
-            except Exception as e:
-                print(f"  XFCE detection error: {e}")
+            for probe in probes:
+                theme = probe()
+                if theme:
+                    return theme
 
-            # 4. Fallback: Qt Palette
-            print("  Using Qt Palette fallback...")
+            # Fallback: Qt Palette
             app = QApplication.instance()
             if app:
                 palette = app.palette()
                 window_color = palette.color(QPalette.ColorRole.Window)
-                text_color = palette.color(QPalette.ColorRole.WindowText)
-
-                # Berechne Helligkeit der Hintergrundfarbe
-                bg_brightness = (window_color.red() + window_color.green() + window_color.blue()) / 3
-                text_brightness = (text_color.red() + text_color.green() + text_color.blue()) / 3
-
-                print(f"  Background brightness: {bg_brightness:.1f}")
-                print(f"  Text brightness: {text_brightness:.1f}")
-
-                # Dark Theme wenn Hintergrund dunkel und Text hell
-                if bg_brightness < 128 and text_brightness > 127:
-                    print(f"  ✅ Detected Dark Theme via Qt Palette")
-                    return 'dark'
-                else:
-                    print(f"  ✅ Detected Light Theme via Qt Palette")
-                    return 'light'
+                brightness = (window_color.red() + window_color.green() + window_color.blue()) / 3
+                return 'dark' if brightness < 128 else 'light'
 
-            print("  ⚠️ No detection method worked, defaulting to light")
             return 'light'
 
-        except Exception as e:
-            print(f"  ❌ Theme detection completely failed: {e}")
+        except:
             return 'light'
 
+    @staticmethod
+    def _probe_kde_theme():
+        """KDE ColorScheme, or None if unavailable"""
+        scheme = _read_kde_color_scheme()
+        if scheme is None:
+            scheme = _run_theme_tool('kreadconfig5', '--file', 'kdeglobals',
+                                     '--group', 'General', '--key', 'ColorScheme')
+        if scheme is None:
+            return None
+        return _theme_mode(scheme)
+
+    @staticmethod
+    def _probe_gnome_theme():
+        """GNOME GTK theme, or None if unavailable"""
+        theme = _read_gnome_gtk_theme()
+        if theme is None:
+            theme = _run_theme_tool('gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme')
+        if theme is None:
+            return None
+        return _theme_mode(theme)
+
+    @staticmethod
+    def _probe_xfce_theme():
+        """XFCE theme name, or None if unavailable"""
+        theme = _read_xfce_theme_name()
+        if theme is None:
+            theme = _run_theme_tool('xfconf-query', '-c', 'xsettings', '-p', '/Net/ThemeName')
+        if theme is None:
+            return None
+        return _theme_mode(theme)
+
     def apply_theme(self):
         """Apply unified theme - Lädt immer styles.css + theme-spezifische CSS"""
         try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-
             # Theme erkennen mit Debug-Output
             detected_theme = self.detect_system_theme()
-            print(f"🎨 Applying theme: {detected_theme}")
-
-            # 1. Immer styles.css laden
-            css_path = os.path.join(base_dir, "styles", "styles.css")
-            css_content = ""
-
-            if os.path.exists(css_path):
-                try:
-                    with open(css_path, "r", encoding='utf-8') as f:
-                        css_content = f.read()
-                    print(f"✅ Loaded CSS: styles.css")
-                except Exception as e:
-                    print(f"⚠️ Failed to load styles.css: {e}")
+            logger.debug("🎨 Applying theme: %s", detected_theme)
+
+            css_path = _STYLES_DIR / "styles.css"
+            theme_css_path = _STYLES_DIR / ("dark_theme.css" if detected_theme == 'dark' else "light_theme.css")
+
+            # Re-read the CSS files only when one of them changed
+            mtimes = (_mtime_ns(css_path), _mtime_ns(theme_css_path))
+            cached = self._css_cache.get(detected_theme)
+            if cached and cached[0] == mtimes:
+                css_content = cached[1]
             else:
-                print(f"⚠️ styles.css not found")
+                css_content = self._read_theme_css(css_path, theme_css_path)
+                self._css_cache[detected_theme] = (mtimes, css_content)
 
-            # 2. Theme-spezifische CSS laden
-            if detected_theme == 'dark':
-                theme_css_path = os.path.join(base_dir, "styles", "dark_theme.css")
+            # 3. Kombinierte CSS anwenden - app-wide, Qt re-polishes all widgets itself
+            app = QApplication.instance()
+            if app:
+                app.setStyleSheet(css_content)
             else:
-                theme_css_path = os.path.join(base_dir, "styles", "light_theme.css")
+                self.setStyleSheet(css_content)
 
-            if os.path.exists(theme_css_path):
-                try:
-                    with open(theme_css_path, "r", encoding='utf-8') as f:
-                        theme_css_content = f.read()
+            logger.debug("🎨 Theme applied successfully: %s (styles.css + theme CSS)", detected_theme)
 
-                    # Kombiniere beide CSS
-                    css_content += "\n\n/* ========== THEME-SPECIFIC CSS ========== */\n"
-                    css_content += theme_css_content
+        except Exception as e:
+            logger.error("❌ Failed to apply theme: %s", e)
 
-                    print(f"✅ Loaded theme CSS: {os.path.basename(theme_css_path)}")
-                except Exception as e:
-                    print(f"⚠️ Failed to load {os.path.basename(theme_css_path)}: {e}")
-            else:
-                print(f"⚠️ {os.path.basename(theme_css_path)} not found")
+    @staticmethod
+    def _read_theme_css(css_path, theme_css_path):
+        """styles.css followed by the theme-specific CSS"""
+        # 1. Immer styles.css laden
+        parts = []
 
-            # 3. Kombinierte CSS anwenden
-            self.setStyleSheet(css_content)
+        try:
+            parts.append(css_path.read_bytes())
+            logger.debug("✅ Loaded CSS: styles.css")
+        except FileNotFoundError:
+            logger.warning("⚠️ styles.css not found")
+        except Exception as e:
+            logger.warning("⚠️ Failed to load styles.css: %s", e)
 
-            # Widget-Updates
-            self.style().unpolish(self)
-            self.style().polish(self)
-            self.update()
+        # 2. Theme-spezifische CSS laden
+        try:
+            theme_css_content = theme_css_path.read_bytes()
 
-            print(f"🎨 Theme applied successfully: {detected_theme} (styles.css + theme CSS)")
+            # Kombiniere beide CSS
+            parts.append(b"\n\n/* ========== THEME-SPECIFIC CSS ========== */\n" + theme_css_content)
 
+            logger.debug("✅ Loaded theme CSS: %s", theme_css_path.name)
+        except FileNotFoundError:
+            logger.warning("⚠️ %s not found", theme_css_path.name)
         except Exception as e:
-            print(f"❌ Failed to apply theme: {e}")
+            logger.warning("⚠️ Failed to load %s: %s", theme_css_path.name, e)
+
+        # Decode once, after joining the raw bytes
+        css_content = b"".join(parts).decode('utf-8', errors='replace')
+        return css_content
 
 
 
@@ -304,6 +372,14 @@ class MainWindow(QMainWindow):
         self.search_box.textChanged.connect(self.on_search_changed)
         layout.addWidget(self.search_box)
 
+        # Debounce: run the search once typing pauses, not on every keystroke
+        self._pending_search = ""
+        self._shown_search = None  # query whose results fill the content area
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search_filter)
+
         # Categories list
         categories_label = QLabel("📂 Categories")
         categories_label.setObjectName("sectionTitle")
@@ -457,7 +533,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(header_layout)
 
         # History table
-        self.history_table = QTableWidget()
+        self.history_table = QTableView()
         self.history_table.setObjectName("historyTable")
         self.setup_history_table()
         layout.addWidget(self.history_table)
@@ -467,10 +543,9 @@ class MainWindow(QMainWindow):
 
     def setup_history_table(self):
         """Setup history table with proper styling"""
-        self.history_table.setColumnCount(6)
-        self.history_table.setHorizontalHeaderLabels([
-            "Time", "Tool", "Category", "Status", "Exit Code", "Duration"
-        ])
+        # Rows come straight from command_history through the model
+        self.history_model = HistoryTableModel(self.command_history, self)
+        self.history_table.setModel(self.history_model)
 
         # Configure columns
         header = self.history_table.horizontalHeader()
@@ -483,8 +558,8 @@ class MainWindow(QMainWindow):
 
         # Styling
         self.history_table.setAlternatingRowColors(True)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.history_table.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
+        self.history_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.history_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
 
 
 
@@ -508,69 +583,17 @@ class MainWindow(QMainWindow):
         self.connection_label.setToolTip("Configuration loaded")
         self.status_bar.addPermanentWidget(self.connection_label)
 
-    def detect_system_theme(self) -> str:
-        """Erkenne System Theme - einfache Version"""
-        try:
-            # KDE
-            try:
-                result = subprocess.run([
-                    'kreadconfig5', '--file', 'kdeglobals',
-                    '--group', 'General', '--key', 'ColorScheme'
-                ], capture_output=True, text=True, timeout=1)
-
-                if result.returncode == 0:
-                    scheme = result.stdout.strip().lower()
-                    return 'dark' if 'dark' in scheme or 'breezedark' in scheme else 'light'
-            except:
-                pass
-
-            # GNOME
-            try:
-                result = subprocess.run([
-                    'gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'
-                ], capture_output=True, text=True, timeout=1)
-
-                if result.returncode == 0:
-                    theme = result.stdout.strip().lower().replace("'", "")
-                    return 'dark' if 'dark' in theme else 'light'
-            except:
-                pass
-
-            # XFCE
-            try:
-                result = subprocess.run([
-                    'xfconf-query', '-c', 'xsettings', '-p', '/Net/ThemeName'
-                ], capture_output=True, text=True, timeout=1)
-
-                if result.returncode == 0:
-                    theme = result.stdout.strip().lower()
-                    return 'dark' if 'dark' in theme else 'light'
-            except:
-                pass
-
-            # Fallback: Qt Palette
-            app = QApplication.instance()
-            if app:
-                palette = app.palette()
-                window_color = palette.color(QPalette.ColorRole.Window)
-                brightness = (window_color.red() + window_color.green() + window_color.blue()) / 3
-                return 'dark' if brightness < 128 else 'light'
-
-            return 'light'
-
-        except:
-            return 'light'
-
     def load_configuration(self):
         """Load configuration and update UI"""
         self.update_status("Loading configuration...", show_progress=True)
 
         try:
             self.categories = self.config_manager.get_config()
+            self._index_tool_categories()
             self.populate_categories()
 
             # Update status
-            total_tools = sum(len(cat.items) for cat in self.categories.values())
+            total_tools = self._total_tools
             self.update_status(f"Loaded {len(self.categories)} categories with {total_tools} tools")
             self.connection_label.setToolTip("Configuration loaded successfully")
 
@@ -579,16 +602,29 @@ class MainWindow(QMainWindow):
             self.update_status("Configuration load failed")
             self.connection_label.setToolTip("Configuration load failed")
 
+    def _index_tool_categories(self):
+        """Map each tool to its category name for grouping search results"""
+        # Keyed by identity: ConfigItem has __slots__, and names may repeat across categories
+        self._tool_to_category = {
+            id(tool): category.name
+            for category in self.categories.values()
+            for tool in category.items
+        }
+
     def populate_categories(self):
         """Populate categories list with improved styling"""
         self.categories_list.clear()
+        self._prune_category_widgets()
 
+        total_tools = 0
         for category in self.config_manager.get_categories():
+            total_tools += len(category.items)
             item = QListWidgetItem()
             item.setText(f"{category.icon}  {category.name}")
             item.setData(Qt.ItemDataRole.UserRole, category.id)
             item.setToolTip(f"{category.description}\n{len(category.items)} tools available")
             self.categories_list.addItem(item)
+        self._total_tools = total_tools  # reused by the status messages
 
         # Auto-select first category
         if self.categories_list.count() > 0:
@@ -613,19 +649,41 @@ class MainWindow(QMainWindow):
         # Clear current content
         self.clear_content_layout()
 
-        # Create category widget
-        category_widget = CategoryWidget(category)
-        category_widget.tool_selected.connect(self.execute_single_tool)
-        category_widget.tools_selected.connect(self.execute_multiple_tools)
+        # Reuse the category widget if this category was shown before
+        category_widget = self._category_widgets.get(category.id)
+        if category_widget is None or category_widget.category is not category:
+            category_widget = CategoryWidget(category)
+            category_widget.tool_selected.connect(self.execute_single_tool)
+            category_widget.tools_selected.connect(self.execute_multiple_tools)
+            self._category_widgets[category.id] = category_widget
 
         self.content_layout.addWidget(category_widget)
+        category_widget.show()
 
     def clear_content_layout(self):
-        """Safely clear content layout"""
+        """Safely clear content layout (pooled category widgets are only hidden)"""
+        self._shown_search = None
         while self.content_layout.count():
             child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            widget = child.widget()
+            if widget is None:
+                continue
+            if self._is_pooled_category_widget(widget):
+                widget.hide()
+            else:
+                widget.deleteLater()
+
+    def _is_pooled_category_widget(self, widget):
+        category = getattr(widget, 'category', None)
+        return category is not None and self._category_widgets.get(category.id) is widget
+
+    def _prune_category_widgets(self):
+        """Drop pooled widgets whose category was replaced by a config reload"""
+        for category_id, widget in list(self._category_widgets.items()):
+            if self.categories.get(category_id) is not widget.category:
+                del self._category_widgets[category_id]
+                if self.content_layout.indexOf(widget) < 0:
+                    widget.deleteLater()
 
     def execute_single_tool(self, tool):
         """Execute single tool with confirmation"""
@@ -636,28 +694,24 @@ class MainWindow(QMainWindow):
         self.output_widget.clear()
 
         # Execute in background
-        self.execution_thread = SafeCommandExecutionThread([tool], self.command_executor)
-        self.execution_thread.progress_updated.connect(self.update_execution_progress)
-        self.execution_thread.command_finished.connect(self.on_execution_finished)
-        self.execution_thread.output_received.connect(self.on_command_output)
-        self.execution_thread.start()
+        self.execution_thread.submit([tool])
 
     def execute_multiple_tools(self, tools_list):
         """Execute multiple tools with enhanced progress tracking - FIXED"""
-        print(f"🔧 DEBUG: execute_multiple_tools called with {len(tools_list)} tools")
-        for tool in tools_list:
-            print(f"  - {tool.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔧 execute_multiple_tools called with %d tools: %s",
+                         len(tools_list), ", ".join(tool.name for tool in tools_list))
 
         if not tools_list:
-            print("❌ DEBUG: No tools provided")
+            logger.debug("❌ No tools provided")
             self.show_warning("No tools selected for execution.")
             return
 
         if not self.confirm_execution(tools_list):
-            print("❌ DEBUG: User cancelled execution")
+            logger.debug("❌ User cancelled execution")
             return
 
-        print("✅ DEBUG: Starting execution...")
+        logger.debug("✅ Starting execution...")
         self.show_output_widget()
 
         # Clear output widget properly
@@ -666,27 +720,13 @@ class MainWindow(QMainWindow):
         else:
             self.output_widget.setText("")
 
-        # Create and start execution thread
+        # Queue the batch on the execution thread
         try:
-            from core.command_executor import SafeCommandExecutionThread
-
-            self.execution_thread = SafeCommandExecutionThread(tools_list, self.command_executor)
-
-            # Connect all signals
-            self.execution_thread.progress_updated.connect(self.update_execution_progress)
-            self.execution_thread.command_finished.connect(self.on_execution_finished)
-            self.execution_thread.output_received.connect(self.on_command_output)
-
-            print("✅ DEBUG: Thread created and signals connected")
-
-            # Start thread
-            self.execution_thread.start()
-            print("✅ DEBUG: Thread started")
+            self.execution_thread.submit(tools_list)
+            logger.debug("✅ Batch queued")
 
         except Exception as e:
-            print(f"❌ DEBUG: Failed to start execution thread: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Failed to start execution: %s", e)
             self.show_error(f"Failed to start execution: {e}")
 
     def confirm_execution(self, tools_list):
@@ -721,18 +761,15 @@ class MainWindow(QMainWindow):
 
     def on_execution_finished(self, results):
         """Handle execution completion"""
+        self._flush_command_output()  # show the last output before any dialog
         self.progress_bar.hide()
 
         # Process results
-        success_count = sum(1 for r in results if r['success'])
+        success_count = sum(1 for r in results if r.success)
         total_count = len(results)
 
-        # Add to history
-        for result_data in results:
-            self.add_to_history(result_data)
-
-        # Update UI
-        self.update_history_table()
+        # Add to history (the model inserts only the new rows)
+        self.history_model.add_entries(self.create_history_entry(result_data) for result_data in results)
 
 
         # Show completion message
@@ -751,11 +788,17 @@ class MainWindow(QMainWindow):
 
     def add_to_history(self, result_data):
         """Add execution result to history"""
+        history_entry = self.create_history_entry(result_data)
+        self.history_model.add_entries([history_entry])
+        return history_entry
+
+    def create_history_entry(self, result_data):
+        """Build the history entry for an execution result"""
         from datetime import datetime
 
-        tool = result_data['tool']
-        result = result_data.get('result')
-        success = result_data['success']
+        tool = result_data.tool
+        result = result_data.result
+        success = result_data.success
 
         history_entry = {
             'time': datetime.now().strftime("%H:%M:%S"),
@@ -767,44 +810,37 @@ class MainWindow(QMainWindow):
             'command': tool.command
         }
 
-        self.command_history.append(history_entry)
-
-    def update_history_table(self):
-        """Update history table with improved styling"""
-        self.history_table.setRowCount(len(self.command_history))
-
-        for row, entry in enumerate(reversed(self.command_history)):  # Latest first
-            # Time
-            self.history_table.setItem(row, 0, QTableWidgetItem(entry['time']))
-
-            # Tool name
-            self.history_table.setItem(row, 1, QTableWidgetItem(entry['tool']))
-
-            # Category
-            self.history_table.setItem(row, 2, QTableWidgetItem(entry['category']))
-
-            # Status with styling
-            status_item = QTableWidgetItem(entry['status'].title())
-            if entry['status'] == 'success':
-                status_item.setForeground(QColor("#10b981"))
-            else:
-                status_item.setForeground(QColor("#ef4444"))
-            self.history_table.setItem(row, 3, status_item)
-
-            # Exit code
-            self.history_table.setItem(row, 4, QTableWidgetItem(str(entry['return_code'])))
-
-            # Duration
-            self.history_table.setItem(row, 5, QTableWidgetItem(entry['duration']))
+        return history_entry
 
     def on_search_changed(self, text):
+        """Queue a search; bursts of keystrokes collapse into one pass"""
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _apply_search_filter(self):
         """Enhanced search functionality"""
+        text = self._pending_search
         if not text.strip():
             self.populate_categories()
             return
 
         # Switch to tools tab and show search results
         self.tab_widget.setCurrentIndex(0)
+        if text == self._shown_search:
+            return  # Typed and deleted back to the results already shown
+
+        # Rebuild the results with painting held back, then lay out once
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            results = self._build_search_results(text)
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+
+        self._shown_search = text
+        self.update_status(f"Search: '{text}' - {len(results)} results found")
+
+    def _build_search_results(self, text):
+        """Fill the content area with the grouped search results"""
         self.clear_content_layout()
 
         # Search header
@@ -819,13 +855,9 @@ class MainWindow(QMainWindow):
             from collections import defaultdict
             grouped_results = defaultdict(list)
 
+            tool_to_category = self._tool_to_category
             for tool in results:
-                category_name = "Unknown"
-                for cat in self.categories.values():
-                    if any(t.name == tool.name for t in cat.items):
-                        category_name = cat.name
-                        break
-                grouped_results[category_name].append(tool)
+                grouped_results[tool_to_category.get(id(tool), "Unknown")].append(tool)
 
             # Display grouped results
             for category_name, tools in grouped_results.items():
@@ -842,7 +874,7 @@ class MainWindow(QMainWindow):
             self.content_layout.addWidget(no_results)
 
         self.content_layout.addStretch()
-        self.update_status(f"Search: '{text}' - {len(results)} results found")
+        return results
 
     def create_search_header(self, query):
         """Create search results header"""
@@ -918,10 +950,15 @@ class MainWindow(QMainWindow):
 
         try:
             self.categories = self.config_manager.get_config(force_update=True)
+            self._index_tool_categories()
             self.populate_categories()
 
+            # Pick up a desktop theme change made since startup
+            self.invalidate_theme_cache()
+            self.apply_theme()
+
 
-            total_tools = sum(len(cat.items) for cat in self.categories.values())
+            total_tools = self._total_tools
             self.update_status(f"Configuration refreshed - {len(self.categories)} categories, {total_tools} tools")
             self.connection_label.setToolTip("Configuration refreshed successfully")
 
@@ -937,6 +974,10 @@ class MainWindow(QMainWindow):
         self.update_status("Running dependency check...", show_progress=True)
 
         try:
+            if self.dependency_checker is None:
+                from core.dependency_check import DependencyChecker
+                self.dependency_checker = DependencyChecker(self)
+
             success = self.dependency_checker.run_startup_check()
 
             if success:
@@ -965,15 +1006,32 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.command_history.clear()
-            self.update_history_table()
+            self.history_model.clear()
 
             self.update_status("Command history cleared")
             self.show_success("Command history cleared successfully!")
 
     def on_command_output(self, output_type, text):
-        """Handle command output - ensure this runs in main thread"""
+        """Handle command output - ensure this runs in main thread
+
+        Chunks are collected and written once per UI tick, so a chatty command
+        causes one text layout per tick instead of one per signal.
+        """
         if hasattr(self, 'output_widget') and self.output_widget.isVisible():
+            self._output_pending.append((output_type, text))
+            if len(self._output_pending) >= self.OUTPUT_FLUSH_CHUNKS:
+                self._flush_command_output()
+            elif not self._output_timer.isActive():
+                self._output_timer.start()
+
+    def _flush_command_output(self):
+        """Write pending output, merging consecutive chunks of the same stream"""
+        self._output_timer.stop()
+        pending, self._output_pending = self._output_pending, []
+
+        for output_type, chunks in groupby(pending, key=itemgetter(0)):
+            text = "\n".join(chunk for _, chunk in chunks)
+
             # This should now be thread-safe since it's called via signal
             if hasattr(self.output_widget, 'append_output'):
                 self.output_widget.append_output(output_type, text)
@@ -1036,7 +1094,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle application close"""
         # Stop any running execution thread
-        if self.execution_thread and self.execution_thread.isRunning():
+        if self.execution_thread and self.execution_thread.is_busy():
             reply = QMessageBox.question(
                 self,
                 "Exit Application",
@@ -1052,5 +1110,7 @@ class MainWindow(QMainWindow):
             # Terminate execution thread
             self.execution_thread.terminate()
             self.execution_thread.wait(3000)  # Wait up to 3 seconds
+        elif self.execution_thread:
+            self.execution_thread.stop()
 
         event.accept()
@@ -2,6 +2,21 @@
 GUI Widgets Package
 """
 
-from .category_widget import CategoryWidget, ToolCard
+from importlib import import_module
+
+# Widget modules are imported on first attribute access (PEP 562)
+_LAZY_WIDGETS = {
+    'CategoryWidget': '.category_widget',
+    'ToolCard': '.category_widget',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_WIDGETS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = ['CategoryWidget', 'ToolCard']
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
     QCheckBox, QScrollArea, QFrame, QMessageBox, QGridLayout,
     QButtonGroup
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QColor
 
 class ToolCard(QFrame):
@@ -22,9 +22,7 @@ class ToolCard(QFrame):
         super().__init__()
         self.tool = tool
         self.is_selected = False
-        self.is_hovered = False
         self.setup_ui()
-        self.setup_animations()
 
     def setup_ui(self):
         """Setup tool card UI with modern design"""
@@ -69,12 +67,8 @@ class ToolCard(QFrame):
         self.desc_label.setMaximumHeight(40)
         layout.addWidget(self.desc_label)
 
-        # Command preview
-        cmd_preview = self.tool.command
-        if len(cmd_preview) > 70:
-            cmd_preview = cmd_preview[:67] + "..."
-
-        self.cmd_label = QLabel(f"{cmd_preview}")
+        # Command preview (shortened once at config load)
+        self.cmd_label = QLabel(self.tool.command_preview)
         self.cmd_label.setObjectName("commandPreview")
         layout.addWidget(self.cmd_label)
 
@@ -106,15 +100,6 @@ class ToolCard(QFrame):
         layout.addLayout(footer_layout)
         self.setLayout(layout)
 
-
-    def setup_animations(self):
-        """Setup hover animations"""
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(150)
-        self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-
-
     def on_selection_changed(self, state):
         """Handle selection state change"""
         self.is_selected = state == Qt.CheckState.Checked.value
@@ -124,27 +109,21 @@ class ToolCard(QFrame):
         """Programmatically set selection state"""
         self.checkbox.setChecked(selected)
 
-    def enterEvent(self, event):
-        """Mouse enter event"""
-        self.is_hovered = True
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        """Mouse leave event"""
-        self.is_hovered = False
-        super().leaveEvent(event)
-
 class CategoryWidget(QWidget):
     """Modern category widget"""
 
     tool_selected = pyqtSignal(object)
     tools_selected = pyqtSignal(list)
 
+    CARD_BATCH = 24  # cards built up front and per scroll step
+    SCROLL_PRELOAD_PX = 200  # build the next batch this close to the bottom
+
     def __init__(self, category):
         super().__init__()
         self.category = category
         self.selected_tools = {}
         self.tool_cards = []
+        self._stretch_row = None
         self.view_mode = "grid"  # grid or list
         self.setup_ui()
 
@@ -313,6 +292,12 @@ class CategoryWidget(QWidget):
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setObjectName("toolsScrollArea")
+        self.tools_scroll_area = scroll_area
+
+        # Cards are built batch by batch as the user scrolls towards the end
+        scroll_bar = scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.load_more_tools)
+        scroll_bar.rangeChanged.connect(self.load_more_tools)
 
         # Tools container
         self.tools_container = QWidget()
@@ -337,28 +322,80 @@ class CategoryWidget(QWidget):
         for card in self.tool_cards:
             card.setParent(None)
         self.tool_cards.clear()
+        self._set_stretch_row(None)
+
+        # Only the first batch is built now, the rest follows on scroll
+        self.add_tool_cards(self.CARD_BATCH)
 
-        # Create new cards
-        for i, tool in enumerate(self.category.items):
+    def add_tool_cards(self, count):
+        """Build the next `count` tool cards"""
+        tools = self.category.items
+        start = len(self.tool_cards)
+        end = min(start + count, len(tools))
+
+        for i in range(start, end):
+            tool = tools[i]
             tool_card = ToolCard(tool)
+            if tool.name in self.selected_tools:
+                tool_card.set_selected(True)  # Selected via "Select All" before it was built
             tool_card.selection_changed.connect(self.on_tool_selection_changed)
             tool_card.tool_selected.connect(self.tool_selected.emit)
 
             self.tool_cards.append(tool_card)
+            self._place_tool_card(tool_card, i)
+
+        self._update_stretch_row()
 
-            # Add to layout based on view mode
-            if self.view_mode == "grid":
-                row = i // 2  # 2 columns
-                col = i % 2
-                self.tools_layout.addWidget(tool_card, row, col)
-            else:  # list mode
-                self.tools_layout.addWidget(tool_card, i, 0, 1, 2)
+        # Once laid out, fill up the viewport if the batch did not reach its end
+        if len(self.tool_cards) < len(tools):
+            QTimer.singleShot(0, self.load_more_tools)
 
-        # Add stretch at the end
+    def _place_tool_card(self, tool_card, i):
+        """Add a card to the layout based on view mode"""
         if self.view_mode == "grid":
-            self.tools_layout.setRowStretch(len(self.category.items) // 2 + 1, 1)
-        else:
-            self.tools_layout.setRowStretch(len(self.category.items), 1)
+            row = i // 2  # 2 columns
+            col = i % 2
+            self.tools_layout.addWidget(tool_card, row, col)
+        else:  # list mode
+            self.tools_layout.addWidget(tool_card, i, 0, 1, 2)
+
+    def _update_stretch_row(self):
+        """Keep the stretch below the last card"""
+        built = len(self.tool_cards)
+        self._set_stretch_row(built // 2 + 1 if self.view_mode == "grid" else built)
+
+    def arrange_tool_cards(self):
+        """Move the existing cards into the current view mode's positions"""
+        self.tools_container.setUpdatesEnabled(False)
+        try:
+            for card in self.tool_cards:
+                self.tools_layout.removeWidget(card)
+            for i, card in enumerate(self.tool_cards):
+                self._place_tool_card(card, i)
+            self._update_stretch_row()
+        finally:
+            self.tools_container.setUpdatesEnabled(True)
+
+    def _set_stretch_row(self, row):
+        if self._stretch_row is not None:
+            self.tools_layout.setRowStretch(self._stretch_row, 0)
+        if row is not None:
+            self.tools_layout.setRowStretch(row, 1)
+        self._stretch_row = row
+
+    def load_more_tools(self, *args):
+        """Build another batch once the scroll position nears the end"""
+        if len(self.tool_cards) >= len(self.category.items) or not self.isVisible():
+            return
+
+        scroll_bar = self.tools_scroll_area.verticalScrollBar()
+        if scroll_bar.value() >= scroll_bar.maximum() - self.SCROLL_PRELOAD_PX:
+            self.add_tool_cards(self.CARD_BATCH)
+
+    def showEvent(self, event):
+        """Build more cards if the first batch does not fill the view"""
+        super().showEvent(event)
+        QTimer.singleShot(0, self.load_more_tools)
 
     def set_view_mode(self, mode):
         """Set view mode (grid or list)"""
@@ -371,8 +408,8 @@ class CategoryWidget(QWidget):
         self.grid_btn.setChecked(mode == "grid")
         self.list_btn.setChecked(mode == "list")
 
-        # Recreate layout
-        self.populate_tools()
+        # Rearrange the cards already built, no need to recreate them
+        self.arrange_tool_cards()
 
     def on_tool_selection_changed(self, tool, selected):
         """Handle tool selection change"""
@@ -407,14 +444,19 @@ class CategoryWidget(QWidget):
             self.execute_btn.setText("🚀 Execute Selected Tools")
 
     def select_all_tools(self):
-        """Select all tools"""
+        """Select all tools (cards not built yet pick it up when created)"""
+        for tool in self.category.items:
+            self.selected_tools[tool.name] = tool
         for card in self.tool_cards:
             card.set_selected(True)
+        self.update_selection_ui()
 
     def select_no_tools(self):
         """Deselect all tools"""
+        self.selected_tools.clear()
         for card in self.tool_cards:
             card.set_selected(False)
+        self.update_selection_ui()
 
     def execute_selected_tools(self):
         """Execute selected tools with confirmation"""
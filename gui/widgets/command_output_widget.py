@@ -8,15 +8,20 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
+from collections import Counter, deque
 from datetime import datetime
 
 class CommandOutputWidget(QWidget):
     """Enhanced command output widget with tabs and filtering"""
 
+    MAX_DISPLAY_BLOCKS = 5000  # oldest lines are dropped from each text view beyond this
+
     def __init__(self):
         super().__init__()
-        self.output_buffer = []
         self.max_lines = 1000
+        self.output_buffer = deque(maxlen=self.max_lines)
+        self.line_counts = Counter()  # output_type -> entries in output_buffer
+        self._char_formats = {}  # color -> QTextCharFormat
         self.auto_scroll = True
         self.setup_ui()
 
@@ -136,6 +141,7 @@ class CommandOutputWidget(QWidget):
         text_edit.setObjectName(f"output_{output_type}")
         text_edit.setReadOnly(True)
         text_edit.setFont(QFont("Consolas", 10))
+        text_edit.document().setMaximumBlockCount(self.MAX_DISPLAY_BLOCKS)
 
         # Terminal-like styling
         text_edit.setStyleSheet(f"""
@@ -179,17 +185,16 @@ class CommandOutputWidget(QWidget):
         elif output_type == "stderr":
             self.append_to_text_edit(self.stderr_output, formatted_line, color)
 
-        # Store in buffer
+        # Store in buffer (bounded, the oldest entry drops out of the counts)
+        if len(self.output_buffer) == self.max_lines:
+            self.line_counts[self.output_buffer[0]['type']] -= 1
         self.output_buffer.append({
             'timestamp': timestamp,
             'type': output_type,
             'text': text,
             'formatted': formatted_line
         })
-
-        # Limit buffer size
-        if len(self.output_buffer) > self.max_lines:
-            self.output_buffer = self.output_buffer[-self.max_lines:]
+        self.line_counts[output_type] += 1
 
         # Update tab titles with counters
         self.update_tab_counters()
@@ -200,8 +205,10 @@ class CommandOutputWidget(QWidget):
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
         # Set text color
-        format = QTextCharFormat()
-        format.setForeground(QColor(color))
+        format = self._char_formats.get(color)
+        if format is None:
+            format = self._char_formats[color] = QTextCharFormat()
+            format.setForeground(QColor(color))
         cursor.setCharFormat(format)
 
         # Insert text
@@ -215,8 +222,8 @@ class CommandOutputWidget(QWidget):
     def update_tab_counters(self):
         """Update tab titles with line counters"""
         total_lines = len(self.output_buffer)
-        stdout_lines = len([item for item in self.output_buffer if item['type'] == 'stdout'])
-        stderr_lines = len([item for item in self.output_buffer if item['type'] == 'stderr'])
+        stdout_lines = self.line_counts['stdout']
+        stderr_lines = self.line_counts['stderr']
 
         self.tab_widget.setTabText(0, f"📟 All Output ({total_lines})")
         self.tab_widget.setTabText(1, f"✅ Standard Out ({stdout_lines})")
@@ -245,6 +252,7 @@ class CommandOutputWidget(QWidget):
         self.stdout_output.clear()
         self.stderr_output.clear()
         self.output_buffer.clear()
+        self.line_counts.clear()
 
         # Reset tab titles
         self.tab_widget.setTabText(0, "📟 All Output")
@@ -0,0 +1,88 @@
+"""
+History Model - Command history for a QTableView
+Cells are produced on demand in data(), no per-cell item objects
+"""
+
+from collections import deque
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """Bounded command history, latest entry in the first row"""
+
+    HEADERS = ("Time", "Tool", "Category", "Status", "Exit Code", "Duration")
+    STATUS_COLUMN = 3
+
+    def __init__(self, entries: deque, parent=None):
+        super().__init__(parent)
+        self._entries = entries  # oldest first, shared with the window's command_history
+        self._success_brush = QBrush(QColor("#10b981"))
+        self._failure_brush = QBrush(QColor("#ef4444"))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        entry = self._entries[-1 - index.row()]  # Latest first
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return entry['time']
+            if column == 1:
+                return entry['tool']
+            if column == 2:
+                return entry['category']
+            if column == 3:
+                return entry['status'].title()
+            if column == 4:
+                return str(entry['return_code'])
+            if column == 5:
+                return entry['duration']
+
+        elif role == Qt.ItemDataRole.ForegroundRole and column == self.STATUS_COLUMN:
+            return self._success_brush if entry['status'] == 'success' else self._failure_brush
+
+        return None
+
+    def add_entries(self, entries):
+        """Insert new entries at the top, dropping the oldest beyond the history limit"""
+        entries = list(entries)
+        maxlen = self._entries.maxlen
+        if maxlen is not None:
+            entries = entries[-maxlen:]
+        if not entries:
+            return
+
+        # Entries pushed out of the deque disappear from the bottom of the table
+        if maxlen is not None:
+            overflow = len(self._entries) + len(entries) - maxlen
+            if overflow > 0:
+                count = len(self._entries)
+                self.beginRemoveRows(QModelIndex(), count - overflow, count - 1)
+                for _ in range(overflow):
+                    self._entries.popleft()
+                self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all entries"""
+        self.beginResetModel()
+        self._entries.clear()
+        self.endResetModel()
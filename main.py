@@ -2,6 +2,7 @@
 import sys
 import os
 import argparse
+import logging
 import traceback
 from pathlib import Path
 
@@ -319,6 +320,10 @@ def handle_special_modes(args):
         print("🗑️ Resetting configuration cache...")
         try:
             config_cache = Path(__file__).parent / "data" / "config_cache.yaml"
+            for suffix in (".pkl", ".meta"):  # parsed cache, HTTP validators
+                sidecar = config_cache.with_name(config_cache.name + suffix)
+                if sidecar.exists():
+                    sidecar.unlink()
             if config_cache.exists():
                 config_cache.unlink()
                 print("✅ Configuration cache cleared")
@@ -350,6 +355,12 @@ def main():
     # Setup error handling
     setup_error_handling()
 
+    # GUI diagnostics go through logging; --debug shows them
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING,
+        format="%(message)s"
+    )
+
     # Show startup info
     show_startup_info(args)
 